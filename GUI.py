@@ -1,5 +1,7 @@
 import streamlit as st
-from muller import muller
+from expressions import compile_expression
+from muller import format_number, muller
+from polynomial import MAX_DEGREE, horner, polynomial_coefficients, polynomial_roots
 
 def inject_custom_css():
     st.markdown(
@@ -80,16 +82,22 @@ def muller_app():
         help="If known, enter the true root to calculate Et (%) for each iteration.",
     ).strip()
 
+    find_all = st.checkbox(
+        "Find all roots (polynomials only)",
+        help="Finds every root with Muller's method and deflation; no initial guesses are needed.",
+    )
+
     # Collect errors
     errors = []
     if not equation:
         errors.append("Please enter a valid equation.")
-    if not x0:
-        errors.append("Please enter a valid initial guess for x0.")
-    if not x1:
-        errors.append("Please enter a valid initial guess for x1.")
-    if not x2:
-        errors.append("Please enter a valid initial guess for x2.")
+    if not find_all:
+        if not x0:
+            errors.append("Please enter a valid initial guess for x0.")
+        if not x1:
+            errors.append("Please enter a valid initial guess for x1.")
+        if not x2:
+            errors.append("Please enter a valid initial guess for x2.")
 
     if st.button("Solve Step-by-Step"):
         # If there are errors, display them all
@@ -99,9 +107,29 @@ def muller_app():
             return
 
         try:
-            # Clean and validate the equation
-            f = lambda x: eval(equation.replace("^", "**"))  # Replace ^ with ** for exponentiation
-            f(1)  # Test the equation with a sample value to validate correctness
+            # Polynomials are evaluated with Horner's scheme on their coefficients
+            coefficients = polynomial_coefficients(equation)
+
+            if find_all:
+                if coefficients is None or len(coefficients) < 2:
+                    st.error(f"Finding all roots needs a non-constant polynomial in x of degree at most {MAX_DEGREE}.")
+                    return
+                result = polynomial_roots(coefficients)
+                st.success(f"Found all {len(result['roots'])} roots.")
+                st.table([
+                    {"root": format_number(root), "|f(root)|": f"{residual:.3e}"}
+                    for root, residual in zip(result["roots"], result["residuals"])
+                ])
+                st.write(
+                    f"Largest distance to the companion-matrix eigenvalues: {result['max_discrepancy']:.3e} "
+                    f"({result['evaluations']} polynomial evaluations)"
+                )
+                return
+
+            if coefficients is not None:
+                f = lambda x: horner(coefficients, x)
+            else:
+                f = compile_expression(equation)  # Validated and compiled once, "^" is read as a power
 
             # Parse inputs
             x0 = complex(x0.replace("i", "j"))
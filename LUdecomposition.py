@@ -1,50 +1,572 @@
+import os
 import streamlit as st
 import numpy as np
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from cache import LRUCache, matrix_key
 
 def format_number(value):
     """Format a number to show decimals only when needed."""
+    if isinstance(value, (complex, np.complexfloating)):
+        if not np.isclose(value.imag, 0):
+            return f"{value:.3f}".replace("j", "i").strip("()")
+        value = value.real
     if np.isclose(value, int(value)):
         return f"{int(value)}"  # Show as integer if value is close to an integer
     else:
         return f"{value:.3f}"  # Show with 3 decimals otherwise
 
 def format_matrix(matrix):
-    """Format a matrix to display its elements."""
-    return [[format_number(value) for value in row] for row in matrix]
+    """
+    Format a matrix to display its elements, with the rules of format_number.
 
-def lu_decomposition(A, b):
-    """Perform LU decomposition and solve the system of linear equations."""
-    n = A.shape[0]
-    L = np.zeros((n, n))
-    U = np.zeros((n, n))
-    steps = []
+    The closeness tests run once over the whole array, so only the string
+    conversion itself is done per element.
+    """
+    values = np.asarray(matrix)
+    if values.dtype.kind in "OSU":
+        return values.tolist()  # Already formatted
+    values = np.atleast_2d(values)
+    real = values.real.astype(float)
+    whole = np.trunc(real)
+    integral = np.isclose(real, whole)
+    imaginary = np.iscomplexobj(values) & ~np.isclose(values.imag, 0)
+    if imaginary.any():
+        flat = [
+            f"{v:.3f}".replace("j", "i").strip("()") if c else (f"{int(w)}" if i else f"{r:.3f}")
+            for v, r, w, i, c in zip(values.ravel().tolist(), real.ravel().tolist(), whole.ravel().tolist(),
+                                     integral.ravel().tolist(), imaginary.ravel().tolist())
+        ]
+    else:
+        flat = [f"{int(w)}" if i else f"{r:.3f}"
+                for r, w, i in zip(real.ravel().tolist(), whole.ravel().tolist(), integral.ravel().tolist())]
+    columns = values.shape[1]
+    return [flat[k:k + columns] for k in range(0, len(flat), columns)]
+
+def forward_substitution(L, b, unit_diagonal=False):
+    """
+    Solve L y = b for a lower triangular L, one row at a time.
 
+    Parameters:
+    L (2D array): Lower triangular matrix.
+    b (1D or 2D array): Right-hand side, or one right-hand side per column.
+    unit_diagonal (bool): Treat the diagonal of L as ones (Doolittle factors).
+
+    Returns:
+    ndarray: The solution y, shaped like b.
+    """
+    n = L.shape[0]
+    y = np.array(b, dtype=np.result_type(L, np.asarray(b), np.float32), copy=True)
     for i in range(n):
-        for j in range(i, n):
-            U[i, j] = A[i, j] - sum(L[i, k] * U[k, j] for k in range(i))
+        y[i] -= L[i, :i] @ y[:i]
+        if not unit_diagonal:
+            y[i] /= L[i, i]
+    return y
+
+def back_substitution(U, y):
+    """
+    Solve U x = y for an upper triangular U, one row at a time.
+
+    Parameters:
+    U (2D array): Upper triangular matrix.
+    y (1D or 2D array): Right-hand side, or one right-hand side per column.
+
+    Returns:
+    ndarray: The solution x, shaped like y.
+    """
+    n = U.shape[0]
+    x = np.array(y, dtype=np.result_type(U, np.asarray(y), np.float32), copy=True)
+    for i in range(n - 1, -1, -1):
+        x[i] -= U[i, i + 1:] @ x[i + 1:]
+        x[i] /= U[i, i]
+    return x
+
+def lu_factor(A, block_size=64, workers=None, dtype=None):
+    """
+    Blocked Doolittle LU factorization with partial pivoting, P A = L U.
+
+    Each block of columns (panel) is factored with rank-1 updates, and its
+    unit lower triangular diagonal block L11 is inverted once. The rest of the
+    matrix is then updated tile by tile: each tile of block_size columns gets
+    its block row of U from one product with the inverse of L11 and its
+    trailing part from a second product. Tiles are independent and all their
+    work is in matmul, which releases the GIL, so with workers > 1 they run on
+    a thread pool.
+
+    Parameters:
+    A (2D array): Square coefficient matrix (real or complex).
+    block_size (int): Number of columns per panel and per tile.
+    workers (int, optional): Threads used for the tile updates; None or 1 runs serially.
+    dtype (optional): Working precision; defaults to float64/complex128 as needed by A.
 
-        for j in range(i, n):
-            if i == j:
-                L[i, i] = 1
+    Returns:
+    tuple: (LU, perm) where LU holds U on and above the diagonal and the
+    multipliers of L below it, and A[perm] = L @ U.
+    """
+    LU = np.array(A, dtype=np.result_type(A, float) if dtype is None else dtype, copy=True)
+    if LU.ndim != 2 or LU.shape[0] != LU.shape[1]:
+        raise ValueError("Matrix A must be square.")
+    n = LU.shape[0]
+    perm = np.arange(n)
+    executor = ThreadPoolExecutor(max_workers=workers) if workers and workers > 1 else None
+
+    try:
+        for k0 in range(0, n, block_size):
+            k1 = min(k0 + block_size, n)
+
+            # Factor the panel LU[k0:, k0:k1], swapping whole rows as we pivot
+            for k in range(k0, k1):
+                p = k + int(np.argmax(np.abs(LU[k:, k])))
+                if LU[p, k] == 0:
+                    raise ValueError("Matrix is singular. LU decomposition failed.")
+                if p != k:
+                    LU[[k, p]] = LU[[p, k]]
+                    perm[[k, p]] = perm[[p, k]]
+                LU[k + 1:, k] /= LU[k, k]
+                LU[k + 1:, k + 1:k1] -= np.outer(LU[k + 1:, k], LU[k, k + 1:k1])
+
+            if k1 == n:
+                continue
+            # Multipliers are at most 1 in magnitude with partial pivoting, so the explicit inverse is safe
+            L11_inv = forward_substitution(LU[k0:k1, k0:k1], np.eye(k1 - k0, dtype=LU.dtype), unit_diagonal=True)
+            if executor is None:
+                _update_tile(LU, L11_inv, k0, k1, k1, n)
             else:
-                L[j, i] = (A[j, i] - sum(L[j, k] * U[k, i] for k in range(i))) / U[i, i]
+                tiles = [(j0, min(j0 + block_size, n)) for j0 in range(k1, n, block_size)]
+                for future in [executor.submit(_update_tile, LU, L11_inv, k0, k1, j0, j1) for j0, j1 in tiles]:
+                    future.result()
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-        steps.append({
-            "Step": f"After processing row {i + 1}",
-            "L": L.copy(),
-            "U": U.copy()
-        })
+    return LU, perm
 
-    y = np.zeros(n)
-    for i in range(n):
-        y[i] = (b[i] - sum(L[i, k] * y[k] for k in range(i)))
+def _update_tile(LU, L11_inv, k0, k1, j0, j1):
+    """Finish the block row of U in columns j0:j1 and apply the panel k0:k1 to the rows below it."""
+    LU[k0:k1, j0:j1] = L11_inv @ LU[k0:k1, j0:j1]
+    LU[k1:, j0:j1] -= LU[k1:, k0:k1] @ LU[k0:k1, j0:j1]
 
-    x = np.zeros(n)
-    for i in range(n - 1, -1, -1):
-        x[i] = (y[i] - sum(U[i, k] * x[k] for k in range(i + 1, n))) / U[i, i]
+def unpack_lu(LU, perm):
+    """Split a packed factorization from lu_factor into P, L and U with P A = L U."""
+    n = LU.shape[0]
+    L = np.tril(LU, -1) + np.eye(n, dtype=LU.dtype)
+    U = np.triu(LU)
+    P = np.eye(n)[perm]
+    return P, L, U
+
+def lu_solve(LU, perm, b):
+    """
+    Solve A x = b from a packed factorization returned by lu_factor.
+
+    Returns:
+    tuple: (y, x) where L y = P b and U x = y.
+    """
+    y = forward_substitution(LU, np.asarray(b)[perm], unit_diagonal=True)
+    x = back_substitution(LU, y)
+    return y, x
+
+def lu_solve_mixed(A, b, tol=None, max_iterations=10):
+    """
+    Solve A x = b by factoring in single precision and refining in double precision.
+
+    The float32 (complex64 for complex input) factorization gives a first
+    solution and the corrections; residuals are computed in float64. If the
+    normwise backward error stops halving before reaching tol, the system is
+    re-solved with a full-precision factorization.
+
+    Parameters:
+    A (2D array): Square coefficient matrix.
+    b (1D or 2D array): Constants vector, or one right-hand side per column.
+    tol (float, optional): Target backward error; defaults to sqrt(n) * eps(float64).
+    max_iterations (int): Maximum number of refinement steps.
+
+    Returns:
+    dict: Solution "x", refinement "iterations", final "residual" (infinity norm),
+    "backward_error", its "history", and "fell_back" when full precision was needed.
+    """
+    high = np.result_type(A, b, float)
+    low = np.complex64 if np.iscomplexobj(np.empty(0, dtype=high)) else np.float32
+    A = np.asarray(A, dtype=high)
+    b = np.asarray(b, dtype=high)
+    n = A.shape[0]
+    if tol is None:
+        tol = np.sqrt(n) * np.finfo(high).eps
+    norm_A = np.abs(A).sum(axis=1).max()
+    norm_b = np.abs(b).max()
+
+    def backward_error(x, r):
+        denominator = norm_A * np.abs(x).max() + norm_b
+        return np.abs(r).max() / denominator if denominator else 0.0
+
+    history = []
+    iterations = 0
+    try:
+        LU, perm = lu_factor(A, dtype=low)
+        x = lu_solve(LU, perm, b.astype(low))[1].astype(high)
+        r = b - A @ x
+        error = backward_error(x, r)
+        history.append(error)
+        while error > tol and iterations < max_iterations:
+            x = x + lu_solve(LU, perm, r.astype(low))[1].astype(high)
+            iterations += 1
+            r = b - A @ x
+            previous, error = error, backward_error(x, r)
+            history.append(error)
+            if not error <= 0.5 * previous:
+                break  # Refinement stalled
+    except ValueError:
+        error = np.inf  # Singular in single precision
+
+    fell_back = not error <= tol
+    if fell_back:
+        LU, perm = lu_factor(A)
+        x = lu_solve(LU, perm, b)[1]
+        r = b - A @ x
+        error = backward_error(x, r)
+        history.append(error)
+
+    return {
+        "x": x,
+        "iterations": iterations,
+        "residual": np.abs(r).max(),
+        "backward_error": error,
+        "history": history,
+        "fell_back": fell_back,
+    }
+
+def lu_factor_out_of_core(A, memory_limit=512 * 2**20):
+    """
+    Left-looking blocked LU factorization of a disk-backed matrix, in place.
+
+    The matrix is processed one panel of columns at a time. Each panel is
+    read into memory, updated with the already factored panels (streamed in
+    one at a time), factored with partial pivoting and written back. At most
+    two panels are held in memory, and the panel width is chosen so that
+    they fit in memory_limit. Panel reads are contiguous when the file is
+    stored in Fortran order (np.save of np.asfortranarray(A)).
+
+    Parameters:
+    A (np.memmap or str): Writable square memory-mapped matrix, or the path of
+    a .npy file to open with mmap_mode="r+".
+    memory_limit (int): Working-set budget in bytes.
+
+    Returns:
+    tuple: (LU, perm) as returned by lu_factor, with LU being the memory map
+    that now holds the packed factors.
+    """
+    if isinstance(A, (str, os.PathLike)):
+        A = np.load(A, mmap_mode="r+")
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("Matrix A must be square.")
+    n = A.shape[0]
+    block_size = int(max(1, min(n, memory_limit // (2 * n * A.dtype.itemsize))))
+    perm = np.arange(n)
+    panels = []  # (p0, p1, inverse of the row order the panel was written in)
+
+    for j0 in range(0, n, block_size):
+        j1 = min(j0 + block_size, n)
+        panel = np.asarray(A[:, j0:j1])[perm]
+
+        # Apply every factored panel; rows swapped since it was written are reordered on load
+        for p0, p1, stored_rows in panels:
+            Lp = np.asarray(A[p0:, p0:p1])[stored_rows[perm[p0:]] - p0]
+            panel[p0:p1] = forward_substitution(Lp[:p1 - p0], panel[p0:p1], unit_diagonal=True)
+            panel[p1:] -= Lp[p1 - p0:] @ panel[p0:p1]
+
+        for k in range(j1 - j0):
+            r = j0 + k
+            p = r + int(np.argmax(np.abs(panel[r:, k])))
+            if panel[p, k] == 0:
+                raise ValueError("Matrix is singular. LU decomposition failed.")
+            if p != r:
+                panel[[r, p]] = panel[[p, r]]
+                perm[[r, p]] = perm[[p, r]]
+            panel[r + 1:, k] /= panel[r, k]
+            panel[r + 1:, k + 1:] -= np.outer(panel[r + 1:, k], panel[r, k + 1:])
+
+        A[:, j0:j1] = panel
+        panels.append((j0, j1, np.argsort(perm)))
+
+    # Bring the multipliers of earlier panels into the final row order
+    for p0, p1, stored_rows in panels[:-1]:
+        A[p0:, p0:p1] = np.asarray(A[p0:, p0:p1])[stored_rows[perm[p0:]] - p0]
+    if isinstance(A, np.memmap):
+        A.flush()
+
+    return A, perm
+
+def lu_solve_out_of_core(LU, perm, b, memory_limit=512 * 2**20):
+    """
+    Solve A x = b with disk-backed factors from lu_factor_out_of_core.
+
+    The triangular factors are streamed in strips of rows that fit in memory_limit.
+
+    Returns:
+    tuple: (y, x) where L y = P b and U x = y.
+    """
+    n = LU.shape[0]
+    rows = int(max(1, min(n, memory_limit // (n * LU.dtype.itemsize))))
+    b = np.asarray(b)[perm]
+    y = np.zeros(b.shape, dtype=np.result_type(LU, b, float))
+    x = np.zeros_like(y)
+
+    for i0 in range(0, n, rows):
+        i1 = min(i0 + rows, n)
+        strip = np.asarray(LU[i0:i1, :i1])
+        y[i0:i1] = forward_substitution(strip[:, i0:], b[i0:i1] - strip[:, :i0] @ y[:i0], unit_diagonal=True)
+
+    for i1 in range(n, 0, -rows):
+        i0 = max(i1 - rows, 0)
+        strip = np.asarray(LU[i0:i1, i0:])
+        x[i0:i1] = back_substitution(strip[:, :i1 - i0], y[i0:i1] - strip[:, i1 - i0:] @ x[i1:])
+
+    return y, x
+
+class LUFactorization:
+    """
+    A factored matrix that can be reused for any number of right-hand sides.
+
+    Parameters:
+    A (2D array): Square coefficient matrix (real or complex).
+    """
+
+    def __init__(self, A):
+        self.LU, self.perm = lu_factor(A)
+        self.n = self.LU.shape[0]
+
+    @property
+    def nbytes(self):
+        return self.LU.nbytes + self.perm.nbytes
+
+    @property
+    def P(self):
+        return unpack_lu(self.LU, self.perm)[0]
+
+    @property
+    def L(self):
+        return unpack_lu(self.LU, self.perm)[1]
+
+    @property
+    def U(self):
+        return unpack_lu(self.LU, self.perm)[2]
+
+    def solve(self, B):
+        """Solve A X = B, where B is a vector or has one right-hand side per column."""
+        return lu_solve(self.LU, self.perm, B)[1]
+
+    def inverse(self):
+        """Return A inverse by solving against every column of the identity."""
+        return self.solve(np.eye(self.n, dtype=self.LU.dtype))
+
+    def det(self):
+        """Return det(A) from the diagonal of U and the parity of the row permutation."""
+        return _permutation_sign(self.perm) * np.prod(np.diag(self.LU))
+
+def _permutation_sign(perm):
+    """Return +1 or -1 for an even or odd permutation."""
+    seen = np.zeros(len(perm), dtype=bool)
+    sign = 1
+    for start in range(len(perm)):
+        length = 0
+        i = start
+        while not seen[i]:
+            seen[i] = True
+            i = perm[i]
+            length += 1
+        if length and length % 2 == 0:
+            sign = -sign
+    return sign
+
+# Factorizations keyed by a content hash of A, so repeated solves skip the O(n^3) work
+_factorization_cache = LRUCache(max_entries=16, max_bytes=256 * 2**20)
+
+def lu_factorization(A, cache=True):
+    """
+    Return an LUFactorization of A, reusing a cached one when A was factored before.
+
+    Parameters:
+    A (2D array): Square coefficient matrix.
+    cache (bool): Look up and store the factorization in the shared LRU cache.
+
+    Returns:
+    LUFactorization: The factorization of A.
+    """
+    if not cache:
+        return LUFactorization(A)
+    key = matrix_key(A)
+    factorization = _factorization_cache.get(key)
+    if factorization is None:
+        factorization = LUFactorization(A)
+        _factorization_cache.put(key, factorization, factorization.nbytes)
+    return factorization
+
+# How much of the factorization lu_decomposition keeps for replaying its steps
+RECORD_LEVELS = ("none", "summary", "delta", "full")
+
+class LUSteps(Sequence):
+    """
+    Steps of lu_decomposition stored as the row of U and column of L written at each step.
+
+    Indexing rebuilds the intermediate L and U on demand, so the storage is
+    O(n^2) instead of the O(n^3) needed for a snapshot of both per step.
+    """
+
+    def __init__(self, L, U):
+        n = L.shape[0]
+        self.shape = L.shape
+        self.dtype = L.dtype
+        self.u_rows = [U[i, i:].copy() for i in range(n)]
+        self.l_columns = [L[i:, i].copy() for i in range(n)]
+
+    def __len__(self):
+        return len(self.u_rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("step index out of range")
+        L = np.zeros(self.shape, dtype=self.dtype)
+        U = np.zeros(self.shape, dtype=self.dtype)
+        for i in range(index + 1):
+            U[i, i:] = self.u_rows[i]
+            L[i:, i] = self.l_columns[i]
+        return {"Step": f"After processing row {index + 1}", "L": L, "U": U}
+
+def lu_decomposition(A, b, record="delta", formatted=True):
+    """
+    Perform LU decomposition with partial pivoting and solve the system of linear equations.
+
+    Parameters:
+    A (2D array): Square coefficient matrix.
+    b (1D array): Constants vector.
+    record (str): How the steps are kept: "none" (no steps), "summary" (pivot of
+    each step only), "delta" (row of U and column of L per step, rebuilt on
+    demand) or "full" (a copy of L and U after every step).
+    formatted (bool): Return P, L, U, y and x as display strings; False returns
+    the arrays, which skips the per-element formatting for large systems.
+
+    Returns:
+    dict: P, L, U, y and x (formatted or as arrays), and the recorded steps.
+    """
+    if record not in RECORD_LEVELS:
+        raise ValueError(f"record must be one of {', '.join(RECORD_LEVELS)}.")
+    LU, perm = lu_factor(A)
+    P, L, U = unpack_lu(LU, perm)
+    y, x = lu_solve(LU, perm, b)
+
+    # Row i of U and column i of L are final once row i is processed
+    if record == "none":
+        steps = []
+    elif record == "summary":
+        steps = [
+            {"Step": f"After processing row {i + 1}", "pivot_row": int(perm[i]) + 1, "pivot": LU[i, i]}
+            for i in range(LU.shape[0])
+        ]
+    elif record == "delta":
+        steps = LUSteps(L, U)
+    else:
+        steps = list(LUSteps(L, U))
+
+    if not formatted:
+        return {"P": P, "L": L, "U": U, "x": x, "steps": steps, "y": y}
+    return {"P": format_matrix(P), "L": format_matrix(L), "U": format_matrix(U), "x": format_matrix([x])[0], "steps": steps, "y": format_matrix([y])[0]}
+
+
+def lu_factor_batched(A):
+    """
+    LU factorization with partial pivoting of a stack of matrices, P A[i] = L U.
+
+    Every member is processed by the same vectorized column steps. A member
+    whose pivot vanishes (relative to its largest entry) is marked singular
+    and the remaining steps carry on for the rest of the stack.
+
+    Parameters:
+    A (3D array): Stack of square matrices shaped (batch, n, n).
+
+    Returns:
+    tuple: (LU, perm, singular) with packed factors shaped (batch, n, n),
+    row permutations shaped (batch, n) and a boolean mask of singular members.
+    """
+    LU = np.array(A, dtype=np.result_type(A, float), copy=True)
+    if LU.ndim != 3 or LU.shape[1] != LU.shape[2]:
+        raise ValueError("A must be a stack of square matrices shaped (batch, n, n).")
+    batch, n = LU.shape[:2]
+    members = np.arange(batch)
+    perm = np.tile(np.arange(n), (batch, 1))
+    singular = np.zeros(batch, dtype=bool)
+    tolerance = n * np.finfo(LU.real.dtype).eps * np.abs(LU).max(axis=(1, 2))
+
+    for k in range(n):
+        p = k + np.argmax(np.abs(LU[:, k:, k]), axis=1)
+        pivot_row = LU[members, p].copy()
+        LU[members, p] = LU[:, k]
+        LU[:, k] = pivot_row
+        perm[members, k], perm[members, p] = perm[members, p], perm[members, k]
+
+        pivot = LU[:, k, k]
+        zero = np.abs(pivot) <= tolerance
+        singular |= zero
+        LU[:, k + 1:, k] /= np.where(zero, 1, pivot)[:, None]
+        LU[:, k + 1:, k + 1:] -= LU[:, k + 1:, k, None] * LU[:, None, k, k + 1:]
+
+    return LU, perm, singular
+
+def lu_solve_batched(LU, perm, B, singular=None):
+    """
+    Solve every system of a stack factored by lu_factor_batched.
+
+    Parameters:
+    LU, perm: Factors returned by lu_factor_batched.
+    B (2D or 3D array): Right-hand sides shaped (batch, n) or (batch, n, k).
+    singular (1D bool array, optional): Members whose solution is set to NaN.
+
+    Returns:
+    tuple: (y, x) shaped like B, where L y = P b and U x = y for each member.
+    """
+    B = np.asarray(B)
+    vector = B.ndim == 2
+    if vector:
+        B = B[:, :, None]
+    batch, n = LU.shape[:2]
+    members = np.arange(batch)[:, None]
+
+    y = np.array(B[members, perm], dtype=np.result_type(LU, B), copy=True)
+    for i in range(1, n):
+        y[:, i] -= np.einsum("bj,bjk->bk", LU[:, i, :i], y[:, :i])
+
+    x = y.copy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(n - 1, -1, -1):
+            x[:, i] -= np.einsum("bj,bjk->bk", LU[:, i, i + 1:], x[:, i + 1:])
+            x[:, i] /= LU[:, i, i, None]
+    if singular is not None:
+        x[singular] = np.nan
+
+    if vector:
+        return y[:, :, 0], x[:, :, 0]
+    return y, x
+
+def lu_decomposition_batched(A, B):
+    """
+    Factor and solve a stack of systems A[i] x[i] = B[i] in one vectorized pass.
 
+    Parameters:
+    A (3D array): Coefficient matrices shaped (batch, n, n).
+    B (2D or 3D array): Right-hand sides shaped (batch, n) or (batch, n, k).
 
-    return {"L": format_matrix(L), "U": format_matrix(U), "x": format_matrix([x])[0], "steps": steps, "y": format_matrix([y])[0]}
+    Returns:
+    dict: Raw arrays "perm", "L", "U", "y", "x" and the "singular" mask.
+    Singular members get NaN solutions instead of raising.
+    """
+    LU, perm, singular = lu_factor_batched(A)
+    y, x = lu_solve_batched(LU, perm, B, singular)
+    n = LU.shape[1]
+    L = np.tril(LU, -1) + np.eye(n, dtype=LU.dtype)
+    U = np.triu(LU)
+    return {"perm": perm, "L": L, "U": U, "y": y, "x": x, "singular": singular}
 
 
 def lu_app():
@@ -90,7 +612,9 @@ def lu_app():
     if not error_message and len(A) == int(size) and len(b) == int(size):
         A = np.array(A)
         b = np.array(b)
-        result = lu_decomposition(A, b)
+        result = lu_decomposition(A, b, formatted=False)
+        st.write("P Matrix (P A = L U):")
+        st.write(format_matrix(result["P"]))
         st.write("L Matrix:")
         st.write(format_matrix(result["L"]))
         st.write("U Matrix:")
@@ -1,6 +1,6 @@
 import streamlit as st
 import numpy as np
-from LUdecomposition import lu_decomposition
+from LUdecomposition import format_matrix, lu_decomposition, lu_factorization
 
 def lu_app():
     st.header("LU Decomposition and Advanced Options")
@@ -32,6 +32,13 @@ def lu_app():
     # Input for vector b if the user selects "Solve Ax = b"
     if operation == "Solve Ax = b":
         b_input = st.text_input("Vector b (use spaces to separate values):", placeholder="e.g., 4+3i 5 6-2i")
+    else:
+        col_index = st.number_input(
+            "Choose the column of the inverse to compute (1-based index):",
+            min_value=1,
+            max_value=int(size),
+            value=1
+        ) - 1  # Convert to 0-based index
 
     # Process inputs and perform calculations only after the button is clicked
     if st.button("Decompose and Solve"):
@@ -78,43 +85,40 @@ def lu_app():
         # Perform calculations if there are no errors
         try:
             if operation == "Solve Ax = b":
-                result = lu_decomposition(A, b)
-                L, U, x, y, steps = result["L"], result["U"], result["x"], result["y"], result["steps"]
+                # Steps are not displayed on this page; only what is shown gets formatted
+                result = lu_decomposition(A, b, record="none", formatted=False)
+                P, L, U, x, y = result["P"], result["L"], result["U"], result["x"], result["y"]
 
-                st.success("LU Decomposition Completed:")
+                st.success("LU Decomposition Completed (P A = L U):")
+                st.write("Permutation Matrix (P):")
+                st.write(np.array(format_matrix(P)))
                 st.write("Lower Triangular Matrix (L):")
-                st.write(np.array(L))
+                st.write(np.array(format_matrix(L)))
                 st.write("Upper Triangular Matrix (U):")
-                st.write(np.array(U))
+                st.write(np.array(format_matrix(U)))
 
                 st.success("Solution to Ax = b:")
-                st.write("Intermediate Solution (y):")
-                st.write(np.array(y))
+                st.write("Intermediate Solution (y, from L y = P b):")
+                st.write(np.array(format_matrix([y])[0]))
                 st.write("Final Solution (x):")
-                st.write(np.array(x))
+                st.write(np.array(format_matrix([x])[0]))
 
             elif operation == "Compute a column of A inverse":
-                col_index = st.number_input(
-                    "Choose the column of the inverse to compute (1-based index):",
-                    min_value=1,
-                    max_value=size,
-                    value=1
-                ) - 1  # Convert to 0-based index
-
+                # The factorization is cached by the contents of A, so other columns reuse it
+                factorization = lu_factorization(A)
                 I = np.eye(size, dtype=complex)
-                b = I[:, col_index]  # Take the corresponding column of the identity matrix
-
-                result = lu_decomposition(A, b)
-                L, U, x, y, steps = result["L"], result["U"], result["x"], result["y"], result["steps"]
+                x = factorization.solve(I[:, col_index])  # Solve against the matching column of the identity
 
-                st.success("LU Decomposition Completed:")
+                st.success("LU Decomposition Completed (P A = L U):")
+                st.write("Permutation Matrix (P):")
+                st.write(np.array(format_matrix(factorization.P)))
                 st.write("Lower Triangular Matrix (L):")
-                st.write(np.array(L))
+                st.write(np.array(format_matrix(factorization.L)))
                 st.write("Upper Triangular Matrix (U):")
-                st.write(np.array(U))
+                st.write(np.array(format_matrix(factorization.U)))
 
                 st.success(f"Column {col_index + 1} of A Inverse:")
-                st.write(np.array(x))
+                st.write(np.array(format_matrix([x])[0]))
 
         except Exception as e:
             st.error(f"Error: {e}")
@@ -0,0 +1,131 @@
+import time
+
+import numpy as np
+
+def _converged(x_new, x, atol, rtol):
+    return np.abs(x_new - x).max() <= atol + rtol * np.abs(x_new).max()
+
+def _plain(g, x, atol, rtol, max_iterations):
+    """Iterate x <- g(x). Returns (x, status, evaluations)."""
+    for k in range(max_iterations):
+        x_new = g(x)
+        if not np.all(np.isfinite(x_new)):
+            return x_new, "diverged", k + 1
+        if _converged(x_new, x, atol, rtol):
+            return x_new, "converged", k + 1
+        x = x_new
+    return x, "max_iterations", max_iterations
+
+def _anderson(g, x, depth, atol, rtol, max_iterations):
+    """Anderson mixing (type II) over the last depth residual differences."""
+    delta_f = []
+    delta_g = []
+    f_prev = g_prev = None
+    for k in range(max_iterations):
+        gx = g(x)
+        if not np.all(np.isfinite(gx)):
+            return gx, "diverged", k + 1
+        if _converged(gx, x, atol, rtol):
+            return gx, "converged", k + 1
+        f = gx - x
+        if f_prev is not None:
+            delta_f.append(f - f_prev)
+            delta_g.append(gx - g_prev)
+            if len(delta_f) > depth:
+                delta_f.pop(0)
+                delta_g.pop(0)
+        f_prev, g_prev = f, gx
+
+        if delta_f:
+            # Mix the last iterates to minimise the linearised residual
+            gamma = np.linalg.lstsq(np.column_stack(delta_f), f, rcond=None)[0]
+            x = gx - np.column_stack(delta_g) @ gamma
+        else:
+            x = gx
+    return x, "max_iterations", max_iterations
+
+def _aitken(g, x, atol, rtol, max_iterations):
+    """Aitken delta-squared extrapolation every two evaluations (vector form of Irons and Tuck)."""
+    evaluations = 0
+    while evaluations + 2 <= max_iterations:
+        x1 = g(x)
+        x2 = g(x1)
+        evaluations += 2
+        if not np.all(np.isfinite(x2)):
+            return x2, "diverged", evaluations
+        if _converged(x1, x, atol, rtol) or _converged(x2, x1, atol, rtol):
+            return x2, "converged", evaluations
+        step = x2 - x1
+        second_difference = step - (x1 - x)
+        denominator = np.vdot(second_difference, second_difference)
+        x = x2 - (np.vdot(second_difference, step) / denominator) * step if denominator else x2
+    return x, "max_iterations", evaluations
+
+def fixed_point(g, x0, method="anderson", depth=5, atol=1e-10, rtol=1e-8, max_iterations=1000, baseline=False):
+    """
+    Solve x = g(x) by fixed-point iteration, optionally accelerated.
+
+    g can be any fixed-point map: a Gauss-Seidel sweep, or a scalar iteration
+    such as x - f(x) / slope for the root finders (scalars are treated as
+    one-element vectors).
+
+    Parameters:
+    g (function): The fixed-point map.
+    x0 (scalar or 1D array): Starting point.
+    method (str): "anderson", "aitken" or None for plain iteration.
+    depth (int): Number of previous differences kept by Anderson mixing.
+    atol, rtol (float): Absolute and relative tolerances on the change of an evaluation.
+    max_iterations (int): Maximum number of evaluations of g.
+    baseline (bool): Also run the plain iteration, to report how many evaluations were saved.
+
+    Returns:
+    dict: "solution", "status", "iteration_count" (evaluations of g) and
+    "elapsed" seconds; with baseline also "baseline_iterations",
+    "baseline_elapsed" and "sweeps_saved".
+    """
+    scalar = np.ndim(x0) == 0
+    x0 = np.atleast_1d(np.array(x0, dtype=np.result_type(x0, float)))
+    if scalar:
+        g_vector = lambda x: np.atleast_1d(g(x[0]))
+    else:
+        g_vector = g
+
+    start = time.perf_counter()
+    if method == "anderson":
+        x, status, evaluations = _anderson(g_vector, x0.copy(), depth, atol, rtol, max_iterations)
+    elif method == "aitken":
+        x, status, evaluations = _aitken(g_vector, x0.copy(), atol, rtol, max_iterations)
+    elif method is None:
+        x, status, evaluations = _plain(g_vector, x0.copy(), atol, rtol, max_iterations)
+    else:
+        raise ValueError("method must be 'anderson', 'aitken' or None.")
+    result = {
+        "solution": x[0] if scalar else x,
+        "status": status,
+        "iteration_count": evaluations,
+        "elapsed": time.perf_counter() - start,
+    }
+
+    if baseline:
+        start = time.perf_counter()
+        _, _, plain_evaluations = _plain(g_vector, x0.copy(), atol, rtol, max_iterations)
+        result["baseline_elapsed"] = time.perf_counter() - start
+        result["baseline_iterations"] = plain_evaluations
+        result["sweeps_saved"] = plain_evaluations - evaluations
+    return result
+
+def aitken_extrapolate(sequence):
+    """
+    Apply Aitken's delta-squared transform to a sequence of iterates.
+
+    Useful on the x column of a fixed-iteration root finder's table.
+
+    Returns:
+    ndarray: Extrapolated values, two shorter than the input.
+    """
+    x = np.asarray(sequence)
+    step = x[2:] - x[1:-1]
+    second_difference = step - (x[1:-1] - x[:-2])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        extrapolated = x[2:] - step**2 / second_difference
+    return np.where(second_difference == 0, x[2:], extrapolated)
@@ -0,0 +1,166 @@
+import numpy as np
+
+def bandwidth(A):
+    """
+    Detect the lower and upper bandwidth of a dense matrix.
+
+    Parameters:
+    A (2D array): Square matrix.
+
+    Returns:
+    tuple: (lower, upper), the number of nonzero diagonals below and above the main one.
+    """
+    rows, cols = np.nonzero(A)
+    if rows.size == 0:
+        return 0, 0
+    return int(max((rows - cols).max(), 0)), int(max((cols - rows).max(), 0))
+
+def to_banded(A, lower, upper):
+    """
+    Convert a dense matrix to LAPACK-style banded storage.
+
+    The result ab has shape (lower + upper + 1, n) with ab[upper + i - j, j] = A[i, j].
+    """
+    A = np.asarray(A)
+    n = A.shape[0]
+    ab = np.zeros((lower + upper + 1, n), dtype=A.dtype)
+    for offset in range(-lower, upper + 1):  # offset = j - i
+        ab[upper - offset, max(offset, 0):n + min(offset, 0)] = np.diagonal(A, offset)
+    return ab
+
+def thomas(sub, diag, sup, d):
+    """
+    Solve a tridiagonal system with the Thomas algorithm in O(n) time and memory.
+
+    No pivoting is done, so the matrix should be diagonally dominant or
+    symmetric positive definite.
+
+    Parameters:
+    sub (1D array): Subdiagonal, length n - 1.
+    diag (1D array): Main diagonal, length n.
+    sup (1D array): Superdiagonal, length n - 1.
+    d (1D or 2D array): Right-hand side, or one right-hand side per column.
+
+    Returns:
+    ndarray: The solution, shaped like d.
+    """
+    d = np.asarray(d)
+    if d.ndim == 2:
+        return np.column_stack([thomas(sub, diag, sup, d[:, k]) for k in range(d.shape[1])])
+
+    # Plain Python floats are much faster than NumPy scalars in this recurrence
+    a, b, c, d = list(sub), list(diag), list(sup), list(d)
+    n = len(b)
+    c_prime = [0.0] * n
+    d_prime = [0.0] * n
+    beta = b[0]
+    if beta == 0:
+        raise ValueError("Zero pivot encountered in the Thomas algorithm.")
+    d_prime[0] = d[0] / beta
+    for i in range(1, n):
+        c_prime[i - 1] = c[i - 1] / beta
+        beta = b[i] - a[i - 1] * c_prime[i - 1]
+        if beta == 0:
+            raise ValueError("Zero pivot encountered in the Thomas algorithm.")
+        d_prime[i] = (d[i] - a[i - 1] * d_prime[i - 1]) / beta
+
+    x = d_prime
+    for i in range(n - 2, -1, -1):
+        x[i] -= c_prime[i] * x[i + 1]
+    return np.array(x)
+
+def _tridiagonal_dominant(ab):
+    """Whether the tridiagonal matrix in banded storage is (weakly) row diagonally dominant."""
+    off_diagonal = np.zeros(ab.shape[1])
+    off_diagonal[1:] += np.abs(ab[2, :-1])  # Subdiagonal of rows 1 .. n - 1
+    off_diagonal[:-1] += np.abs(ab[0, 1:])  # Superdiagonal of rows 0 .. n - 2
+    return bool(np.all(np.abs(ab[1]) >= off_diagonal))
+
+def banded_lu_solve(ab, lower, upper, b):
+    """
+    Solve a banded system by Gaussian elimination with partial pivoting.
+
+    Rows are kept in a compact (n, 2 * lower + upper + 1) array, which leaves
+    room for the fill-in that row swaps cause above the band. Time is
+    O(n * lower * (lower + upper)) and memory O(n * (2 * lower + upper)).
+
+    Parameters:
+    ab (2D array): Banded storage as produced by to_banded.
+    lower, upper (int): Lower and upper bandwidth.
+    b (1D or 2D array): Right-hand side, or one right-hand side per column.
+
+    Returns:
+    ndarray: The solution, shaped like b.
+    """
+    n = ab.shape[1]
+    span = lower + upper + 1  # Columns a pivot row can reach after swaps
+    dtype = np.result_type(ab, np.asarray(b), np.float32)
+
+    # W[i, j - i + lower] = A[i, j]
+    W = np.zeros((n, lower + span), dtype=dtype)
+    for offset in range(-lower, upper + 1):
+        j = np.arange(max(offset, 0), n + min(offset, 0))
+        W[j - offset, offset + lower] = ab[upper - offset, j]
+
+    y = np.array(b, dtype=dtype, copy=True)
+    for k in range(n):
+        rows = np.arange(k, min(k + lower + 1, n))
+        cols = (k - rows + lower)[:, None] + np.arange(span)
+        block = W[rows[:, None], cols]  # Columns k .. k + span - 1 of the candidate rows
+
+        p = int(np.argmax(np.abs(block[:, 0])))
+        if block[p, 0] == 0:
+            raise ValueError("Matrix is singular. Banded elimination failed.")
+        if p:
+            block[[0, p]] = block[[p, 0]]
+            y[[k, k + p]] = y[[k + p, k]]
+        multipliers = block[1:, 0] / block[0, 0]
+        block[1:] -= np.outer(multipliers, block[0])
+        y[k + 1:k + len(rows)] -= np.multiply.outer(multipliers, y[k])
+        W[rows[:, None], cols] = block
+
+    x = np.zeros((n + span,) + y.shape[1:], dtype=dtype)
+    for i in range(n - 1, -1, -1):
+        x[i] = (y[i] - W[i, lower + 1:lower + span] @ x[i + 1:i + span]) / W[i, lower]
+    return x[:n]
+
+def solve_banded_system(A, b, bands=None):
+    """
+    Solve A x = b using the cheapest path that fits the band structure of A.
+
+    Parameters:
+    A (2D array): Dense square matrix, or banded storage when bands is given.
+    b (1D or 2D array): Right-hand side, or one right-hand side per column.
+    bands (tuple, optional): (lower, upper) bandwidth of A given in banded storage.
+    Without it the bandwidth of the dense A is detected.
+
+    Returns:
+    dict: The solution "x", the "bandwidth" and the "method" used
+    ("diagonal", "thomas", "banded" or "dense").
+    """
+    if bands is None:
+        A = np.asarray(A)
+        n = A.shape[0]
+        lower, upper = bandwidth(A)
+        if lower + upper + 1 > max(n // 4, 3):
+            # Too wide for the band solvers to pay off
+            from LUdecomposition import lu_factor, lu_solve
+            return {"x": lu_solve(*lu_factor(A), b)[1], "bandwidth": (lower, upper), "method": "dense"}
+        ab = to_banded(A, lower, upper)
+    else:
+        lower, upper = bands
+        ab = np.asarray(A)
+
+    if lower == upper == 0:
+        if np.any(ab[0] == 0):
+            raise ValueError("Matrix is singular. Banded elimination failed.")
+        b = np.asarray(b)
+        diag = ab[0] if b.ndim == 1 else ab[0][:, None]
+        return {"x": b / diag, "bandwidth": (lower, upper), "method": "diagonal"}
+    if lower == upper == 1 and _tridiagonal_dominant(ab):
+        # Thomas does not pivot, so it is only used where that is stable
+        try:
+            return {"x": thomas(ab[2, :-1], ab[1], ab[0, 1:], b), "bandwidth": (1, 1), "method": "thomas"}
+        except ValueError:
+            pass  # Zero pivot of a weakly dominant matrix; let the pivoting solver decide
+    return {"x": banded_lu_solve(ab, lower, upper, b), "bandwidth": (lower, upper), "method": "banded"}
@@ -0,0 +1,152 @@
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from muller import muller_batched
+from secant import CONVERGED
+
+# Basin index of starts that did not converge
+NO_ROOT = -1
+
+def _basin_chunk(f, real, imag, h, atol, rtol, max_iterations, cluster_tol):
+    """
+    Run Muller from every point of one block of grid rows and cluster the roots it reaches.
+
+    Runs in a worker process. Only the distinct roots of the block and a label
+    per start are sent back, which keeps the transfer small.
+
+    Returns:
+    tuple: (distinct roots of the block, int32 labels per start or NO_ROOT, function evaluations).
+    """
+    z = real[None, :] + 1j * imag[:, None]
+    result = muller_batched(f, z - h, z + h, z, atol=atol, rtol=rtol, max_iterations=max_iterations)
+    roots = result["root"].ravel()
+    converged = result["status"].ravel() == CONVERGED
+
+    labels = np.full(roots.size, NO_ROOT, dtype=np.int32)
+    if converged.any():
+        # Snap roots to a cluster_tol grid and keep one representative per cell
+        keys = np.round(np.column_stack([roots[converged].real, roots[converged].imag]) / cluster_tol)
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        labels[converged] = inverse.ravel()
+        distinct = roots[converged][first]
+    else:
+        distinct = np.array([], dtype=complex)
+    return distinct, labels.reshape(z.shape), result["evaluations"]
+
+def muller_basins(
+    f, real_range, imag_range, shape=(512, 512), atol=1e-12, rtol=1e-10, max_iterations=50,
+    cluster_tol=1e-6, chunk_points=1 << 16, workers=None
+):
+    """
+    Start Muller from every point of a rectangular grid in the complex plane and map where each start converges.
+
+    The start at grid point z is the triple (z - h, z + h, z), with h half the
+    grid spacing. Blocks of rows are solved in a process pool, each with one
+    vectorized Muller run. Roots closer than cluster_tol are one root. Only the
+    int16 basin image and the root list are kept for the whole grid, so memory
+    stays bounded by the image plus a few blocks in flight (about 32 MB for a
+    4096 x 4096 grid).
+
+    Parameters:
+    f (function): Vectorized complex function. The process pool is only used when f
+    is picklable (e.g. a module-level function or functools.partial(polynomial.horner,
+    coefficients)); lambdas and compiled expressions run in this process.
+    real_range, imag_range (tuple): (min, max) of the real and imaginary axes.
+    shape (tuple): Grid size as (rows, columns); rows run along the imaginary axis.
+    atol, rtol (float): Step tolerances of the Muller runs.
+    max_iterations (int): Maximum Muller iterations per start.
+    cluster_tol (float): Distance below which two roots are the same root.
+    chunk_points (int): Approximate number of starts per block.
+    workers (int, optional): Number of worker processes (default: all cores); 1 runs in this process.
+
+    Returns:
+    dict: "roots" found, how many starts converged to each ("counts"), the
+    "basins" image (int16 index into roots, NO_ROOT where a start failed) and
+    the total function "evaluations".
+    """
+    rows, columns = shape
+    real = np.linspace(*real_range, columns)
+    imag = np.linspace(*imag_range, rows)
+    spacing = min(np.ptp(real) / max(columns - 1, 1), np.ptp(imag) / max(rows - 1, 1))
+    h = spacing / 2 if spacing > 0 else 1e-3
+
+    basins = np.full(shape, NO_ROOT, dtype=np.int16)
+    roots = []
+    counts = []
+    evaluations = 0
+    block_rows = max(1, chunk_points // columns)
+    blocks = [(start, min(start + block_rows, rows)) for start in range(0, rows, block_rows)]
+
+    def merge(start, stop, distinct, labels):
+        """Map the labels of one block onto the global root list and write them into the image."""
+        mapping = np.empty(len(distinct), dtype=np.int16)
+        for k, root in enumerate(distinct):
+            near = [i for i, known in enumerate(roots) if abs(known - root) <= 2 * cluster_tol]
+            if near:
+                mapping[k] = near[0]
+            elif len(roots) >= np.iinfo(np.int16).max:
+                raise ValueError("More distinct roots than an int16 basin image can index; increase cluster_tol.")
+            else:
+                mapping[k] = len(roots)
+                roots.append(root)
+                counts.append(0)
+        if len(mapping):
+            block = np.where(labels == NO_ROOT, NO_ROOT, mapping[np.maximum(labels, 0)])
+        else:
+            block = labels
+        basins[start:stop] = block
+        for index, count in zip(*np.unique(block[block != NO_ROOT], return_counts=True)):
+            counts[index] += count
+
+    def task(start, stop):
+        return (f, real, imag[start:stop], h, atol, rtol, max_iterations, cluster_tol)
+
+    def collect(start, stop, outcome):
+        nonlocal evaluations
+        distinct, labels, count = outcome
+        evaluations += count
+        merge(start, stop, distinct, labels)
+
+    workers = workers or os.cpu_count()
+    if workers > 1:
+        try:
+            pickle.dumps(f)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            workers = 1  # Worker processes cannot receive f
+    if workers == 1:
+        for start, stop in blocks:
+            collect(start, stop, _basin_chunk(*task(start, stop)))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for start, stop in blocks:
+                pending.append((start, stop, executor.submit(_basin_chunk, *task(start, stop))))
+                # Keep only a few blocks in flight so finished labels do not pile up
+                if len(pending) >= 2 * workers:
+                    done_start, done_stop, future = pending.popleft()
+                    collect(done_start, done_stop, future.result())
+            while pending:
+                done_start, done_stop, future = pending.popleft()
+                collect(done_start, done_stop, future.result())
+
+    return {
+        "roots": np.array(roots, dtype=complex),
+        "counts": np.array(counts, dtype=np.int64),
+        "basins": basins,
+        "evaluations": evaluations
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    from functools import partial
+    from polynomial import horner
+
+    result = muller_basins(partial(horner, np.array([1, 0, 0, -1])), (-2, 2), (-2, 2), shape=(256, 256))
+    for root, count in zip(result["roots"], result["counts"]):
+        print(f"{root:.6f}: {count} starts")
+    print(f"Starts that failed: {np.sum(result['basins'] == NO_ROOT)}")
@@ -0,0 +1,233 @@
+"""
+Throughput benchmarks for the numerical solvers.
+
+Run one benchmark by name, or all of them:
+    python benchmarks.py lu-batched
+    python benchmarks.py
+"""
+import sys
+import time
+
+import numpy as np
+
+def timed(func, *args, repeat=3, **kwargs):
+    """Return the best wall-clock time of several calls, and the last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def benchmark_lu_batched(batch=10000, sizes=(3, 5, 10)):
+    """Compare the batched LU solve with a Python loop of single-system solves."""
+    from LUdecomposition import lu_decomposition_batched, lu_factor, lu_solve
+
+    rng = np.random.default_rng(0)
+    print(f"Batched LU vs per-system loop ({batch} systems)")
+    for n in sizes:
+        A = rng.standard_normal((batch, n, n))
+        B = rng.standard_normal((batch, n))
+
+        def loop():
+            return np.array([lu_solve(*lu_factor(A[i]), B[i])[1] for i in range(batch)])
+
+        loop_time, x_loop = timed(loop, repeat=1)
+        batched_time, result = timed(lu_decomposition_batched, A, B)
+        assert np.allclose(result["x"], x_loop)
+        print(
+            f"  n={n:>3}: loop {batch / loop_time:>12,.0f} systems/s, "
+            f"batched {batch / batched_time:>12,.0f} systems/s ({loop_time / batched_time:.1f}x)"
+        )
+
+def benchmark_lu_tiled(n=4096, block_size=256, max_workers=None):
+    """
+    Strong scaling of the tiled LU factorization from 1 to max_workers threads.
+
+    Run with OPENBLAS_NUM_THREADS=1 (or OMP_NUM_THREADS=1) so the parallelism
+    measured comes from the tile scheduler rather than from BLAS itself.
+    """
+    import os
+    from LUdecomposition import lu_factor
+
+    max_workers = max_workers or os.cpu_count()
+    A = np.random.default_rng(0).standard_normal((n, n))
+    print(f"Tiled LU scaling, {n}x{n}, block size {block_size}")
+    serial_time = None
+    for workers in range(1, max_workers + 1):
+        elapsed, _ = timed(lu_factor, A, block_size=block_size, workers=workers, repeat=1)
+        serial_time = serial_time or elapsed
+        gflops = 2 * n**3 / 3 / elapsed / 1e9
+        print(f"  {workers:>2} workers: {elapsed:8.3f} s, {gflops:6.2f} GFLOP/s, speedup {serial_time / elapsed:.2f}x")
+
+def poisson_2d_csr(m):
+    """CSR arrays (indptr, indices, data) of the 5-point Poisson matrix on an m x m grid."""
+    n = m * m
+    i, j = np.divmod(np.arange(n), m)
+    rows = [np.arange(n)]
+    cols = [np.arange(n)]
+    vals = [np.full(n, 4.0)]
+    for di, dj in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        inside = (0 <= i + di) & (i + di < m) & (0 <= j + dj) & (j + dj < m)
+        rows.append(np.arange(n)[inside])
+        cols.append((i[inside] + di) * m + j[inside] + dj)
+        vals.append(np.full(inside.sum(), -1.0))
+    rows, cols, vals = np.concatenate(rows), np.concatenate(cols), np.concatenate(vals)
+    order = np.lexsort((cols, rows))
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols[order], vals[order]
+
+def benchmark_gauss_seidel_csr(grids=(50, 100, 317, 1000), dense_limit=10000, sweeps=3):
+    """Time per sweep of the CSR Gauss-Seidel engine against the dense one on 2D Poisson systems."""
+    from gaussseidel import gauss_seidel, gauss_seidel_csr
+
+    print(f"Gauss-Seidel sweep time on 2D Poisson systems ({sweeps} sweeps)")
+    for m in grids:
+        n = m * m
+        A = poisson_2d_csr(m)
+        b = np.ones(n)
+        csr_time, _ = timed(gauss_seidel_csr, A, b, atol=0, rtol=0, max_iterations=sweeps, repeat=1)
+        line = f"  n={n:>9,}: CSR {csr_time / sweeps:9.4f} s/sweep"
+        if n <= dense_limit:
+            dense = np.zeros((n, n))
+            indptr, indices, data = A
+            dense[np.repeat(np.arange(n), np.diff(indptr)), indices] = data
+            dense_time, _ = timed(
+                gauss_seidel, dense, b, atol=0, rtol=0, max_iterations=sweeps, check_convergence=False, repeat=1
+            )
+            line += f", dense {dense_time / sweeps:9.4f} s/sweep ({dense_time / csr_time:.1f}x)"
+        print(line)
+
+def benchmark_multicolor(m=1000, sweeps=5, max_workers=None):
+    """Time per sweep of multicolor Gauss-Seidel (1..max_workers threads) against sequential and Jacobi sweeps."""
+    import os
+    from gaussseidel import gauss_seidel_csr, greedy_coloring, multicolor_gauss_seidel, weighted_jacobi
+
+    max_workers = max_workers or os.cpu_count()
+    A = poisson_2d_csr(m)
+    b = np.ones(m * m)
+    coloring_time, colors = timed(greedy_coloring, A, repeat=1)
+    print(f"Multicolor Gauss-Seidel on a {m * m:,}-unknown Poisson system ({colors.max() + 1} colors, coloring {coloring_time:.2f} s)")
+
+    elapsed, _ = timed(gauss_seidel_csr, A, b, atol=0, rtol=0, max_iterations=sweeps, repeat=1)
+    print(f"  sequential CSR:        {elapsed / sweeps:8.4f} s/sweep")
+    for workers in range(1, max_workers + 1):
+        elapsed, _ = timed(
+            multicolor_gauss_seidel, A, b, colors=colors, workers=workers, atol=0, rtol=0, max_iterations=sweeps, repeat=1
+        )
+        print(f"  multicolor, {workers:>2} workers: {elapsed / sweeps:8.4f} s/sweep")
+    for workers in range(1, max_workers + 1):
+        elapsed, _ = timed(weighted_jacobi, A, b, workers=workers, atol=0, rtol=0, max_iterations=sweeps, repeat=1)
+        print(f"  weighted Jacobi, {workers:>2} w: {elapsed / sweeps:8.4f} s/sweep")
+
+def benchmark_brent(tol=1e-10):
+    """Function evaluations Brent's method and golden-section search need to reach tol on smooth objectives."""
+    import math
+    from brent import brent
+    from goldensectionrule import golden_section_search
+
+    objectives = [
+        ("exp(-x)(x^2 - 3x + 2), min", lambda x: math.exp(-x) * (x * x - 3 * x + 2), 0.0, 4.0, False, (5 - math.sqrt(5)) / 2),
+        ("(x - 2)^2, min", lambda x: (x - 2) ** 2, 0.0, 3.0, False, 2.0),
+        ("sin(x), max", math.sin, 0.0, 3.0, True, math.pi / 2),
+    ]
+    print(f"Brent vs golden-section search, tol={tol:g}")
+    for name, f, xl, xu, find_max, x_true in objectives:
+        result_brent = brent(f, xl, xu, find_max, tol=tol)
+        result_golden = golden_section_search(f, xl, xu, find_max, tol=tol)
+        print(
+            f"  {name:<26} brent {result_brent['evaluations']:>3} evals (|dx| {abs(result_brent['x_opt'] - x_true):.1e}), "
+            f"golden {result_golden['evaluations']:>3} evals (|dx| {abs(result_golden['x_opt'] - x_true):.1e})"
+        )
+
+def benchmark_root_batched(batch=10000):
+    """Batched secant and Muller against a Python loop of scalar runs on x^2 - c = 0 for many c."""
+    import math
+    from muller import muller, muller_batched
+    from secant import CONVERGED, secant_batched, secant_method_fixed_iterations
+
+    c = np.random.default_rng(0).uniform(1, 100, batch)
+    print(f"Batched root finding vs per-problem loop ({batch} problems)")
+
+    def secant_loop():
+        roots = []
+        for ci in c:
+            # The scalar method raises once f(x1) == f(x0), which converged lanes reach
+            try:
+                roots.append(secant_method_fixed_iterations(lambda x: x * x - ci, 1.0, 2.0, iterations=8)["root"])
+            except ValueError:
+                roots.append(math.nan)
+        return roots
+
+    loop_time, _ = timed(secant_loop, repeat=1)
+    batched_time, result = timed(secant_batched, lambda x, c: x * x - c, 1.0, 2.0, args=(c,))
+    assert np.all(result["status"] == CONVERGED) and np.allclose(result["root"], np.sqrt(c))
+    print(f"  secant: loop {loop_time:.3f} s, batched {batched_time:.4f} s ({loop_time / batched_time:.0f}x)")
+
+    def muller_loop():
+        # The scalar runs format every step, so only a tenth of the batch is timed and scaled up
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return [muller(lambda x: x * x - ci, 0j, 1 + 0j, 2 + 0j, max_iter=8) for ci in c[: batch // 10]]
+
+    loop_time, _ = timed(muller_loop, repeat=1)
+    loop_time *= batch / (batch // 10)
+    batched_time, result = timed(muller_batched, lambda x, c: x * x - c, 0, 1, 2, args=(c,))
+    assert np.all(result["status"] == CONVERGED) and np.allclose(result["root"] ** 2, c)
+    print(f"  muller: loop {loop_time:.3f} s, batched {batched_time:.4f} s ({loop_time / batched_time:.0f}x)")
+
+def benchmark_basins(size=1024, max_workers=None):
+    """Throughput of the multi-start Muller basin map of z^3 - 1 from 1 to max_workers processes."""
+    import os
+    from functools import partial
+    from basins import muller_basins
+    from polynomial import horner
+
+    max_workers = max_workers or os.cpu_count()
+    f = partial(horner, np.array([1.0, 0.0, 0.0, -1.0]))
+    print(f"Muller basin map of z^3 - 1 on a {size}x{size} grid")
+    for workers in range(1, max_workers + 1):
+        elapsed, result = timed(muller_basins, f, (-2, 2), (-2, 2), shape=(size, size), workers=workers, repeat=1)
+        print(
+            f"  {workers:>2} workers: {elapsed:7.3f} s, {size * size / elapsed:>12,.0f} starts/s, "
+            f"{len(result['roots'])} roots"
+        )
+
+def benchmark_expressions(equation="e**-x * (x**2 - 3*x + 2) + sin(x)**2", calls=10000):
+    """Per-call cost of eval against a compiled expression, and the cost of compiling cold and from the cache."""
+    import math
+    from expressions import _expression_cache, compile_expression
+
+    namespace = {"e": math.e, "sin": math.sin}
+    text = equation.replace("^", "**")
+
+    def eval_calls():
+        return [eval(text, namespace, {"x": x}) for x in np.linspace(0, 1, calls)]
+
+    eval_time, _ = timed(eval_calls, repeat=1)
+    _expression_cache.clear()
+    cold_time, f = timed(compile_expression, equation, repeat=1)
+    warm_time, _ = timed(compile_expression, equation)
+    compiled_time, _ = timed(lambda: [f(x) for x in np.linspace(0, 1, calls)], repeat=1)
+    array_time, _ = timed(f, np.linspace(0, 1, calls))
+    print(f"Expression evaluation, {calls} points of {equation}")
+    print(f"  eval per call:          {eval_time / calls * 1e6:8.2f} us")
+    print(f"  compiled, scalar calls: {compiled_time / calls * 1e6:8.2f} us")
+    print(f"  compiled, one array:    {array_time / calls * 1e6:8.4f} us per point")
+    print(f"  compile cold {cold_time * 1e3:.2f} ms, from cache {warm_time * 1e6:.1f} us")
+
+BENCHMARKS = {
+    "lu-batched": benchmark_lu_batched,
+    "lu-tiled": benchmark_lu_tiled,
+    "gauss-seidel-csr": benchmark_gauss_seidel_csr,
+    "multicolor": benchmark_multicolor,
+    "brent": benchmark_brent,
+    "root-batched": benchmark_root_batched,
+    "basins": benchmark_basins,
+    "expressions": benchmark_expressions,
+}
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
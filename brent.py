@@ -0,0 +1,115 @@
+import math
+
+from cache import CountedFunction
+from goldensectionrule import PHI
+from history import collect
+from quadraticinterpolation import parabolic_vertex
+
+# Fraction of the larger segment covered by a golden-section step, 1 - 0.618... = 0.381...
+GOLDEN_STEP = 1 - PHI
+SQRT_EPS = math.sqrt(2.220446049250313e-16)
+
+def iter_brent(f, xl, xu, find_max=True, tol=1e-10, max_iterations=500):
+    """
+    Run Brent's method on [xl, xu] and yield the record of each iteration as it is computed.
+
+    Each step fits a parabola through the three best points so far (the
+    quadratic interpolation formula) and moves to its vertex when that stays
+    inside the bracket and shrinks the step fast enough; otherwise it takes a
+    golden-section step into the larger segment. The bracket [a, b] always
+    contains the optimum, and each iteration costs one function evaluation.
+
+    Returns (as the generator's return value):
+    tuple: (x_opt, f_opt, converged).
+    """
+    sign = -1 if find_max else 1  # Maximizing f is minimizing -f
+    a, b = xl, xu
+    x = w = v = a + GOLDEN_STEP * (b - a)
+    fx = fw = fv = sign * f(x)
+    d = e = 0.0  # Last step and the step before it
+
+    for i in range(max_iterations):
+        m = (a + b) / 2
+        tol1 = SQRT_EPS * abs(x) + tol / 3
+        tol2 = 2 * tol1
+        if abs(x - m) <= tol2 - (b - a) / 2:
+            return x, sign * fx, True
+
+        step = "golden"
+        if abs(e) > tol1:
+            u = parabolic_vertex(v, w, x, fv, fw, fx)
+            if u is not None and a < u < b and abs(u - x) < abs(e) / 2:
+                e, d = d, u - x
+                if u - a < tol2 or b - u < tol2:
+                    d = tol1 if m >= x else -tol1  # Do not evaluate too close to the bracket ends
+                step = "parabolic"
+        if step == "golden":
+            e = (a - x) if x >= m else (b - x)
+            d = GOLDEN_STEP * e
+
+        u = x + (d if abs(d) >= tol1 else math.copysign(tol1, d))
+        fu = sign * f(u)
+
+        yield {
+            "Iteration": i + 1,
+            "a": a,
+            "b": b,
+            "x": x,
+            "f(x)": sign * fx,
+            "u": u,
+            "f(u)": sign * fu,
+            "step": step
+        }
+
+        # Shrink the bracket around the best point and keep the three best points
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, fv, w, fw, x, fx = w, fw, x, fx, u, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, fv, w, fw = w, fw, u, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+
+    return x, sign * fx, False
+
+def brent(f, xl, xu, find_max=True, tol=1e-10, max_iterations=500, history=None):
+    """
+    Find the maximum or minimum of f on [xl, xu] with Brent's method.
+
+    Parameters:
+    f (function): The function to optimize.
+    xl, xu (float): Lower and upper bounds of the bracket.
+    find_max (bool): Maximize if True, otherwise minimize.
+    tol (float): Absolute tolerance on x (a relative sqrt(eps) * |x| term is always added).
+    max_iterations (int): Maximum number of iterations.
+    history (IterationHistory, optional): Bounded store for the iteration records;
+    by default every record is kept.
+
+    Returns:
+    dict: "iterations" table, optimum "x_opt" and "f_opt", the number of
+    function "evaluations" and whether the tolerance was reached ("converged").
+    """
+    counted_f = CountedFunction(f)
+    outcome = {}
+
+    def records():
+        outcome["optimum"] = yield from iter_brent(counted_f, xl, xu, find_max, tol, max_iterations)
+
+    table, _ = collect(records(), history)
+    x_opt, f_opt, converged = outcome["optimum"]
+
+    return {
+        "iterations": table,
+        "x_opt": x_opt,
+        "f_opt": f_opt,
+        "evaluations": counted_f.evaluations,
+        "converged": converged
+    }
@@ -0,0 +1,131 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+def matrix_key(A):
+    """
+    Content hash of an array, used to recognise a matrix that was seen before.
+
+    Parameters:
+    A (array_like): The matrix (or any array) to hash.
+
+    Returns:
+    str: Hex digest that depends on the values, shape and dtype of A.
+    """
+    A = np.ascontiguousarray(A)
+    digest = hashlib.blake2b(A.tobytes(), digest_size=16)
+    digest.update(f"{A.shape}{A.dtype.str}".encode())
+    return digest.hexdigest()
+
+class LRUCache:
+    """
+    Least-recently-used cache bounded by an entry count and, optionally, by memory.
+
+    get, put and clear hold a lock, so one instance can be shared by the
+    threads that Streamlit runs each session's script on.
+
+    Parameters:
+    max_entries (int): Maximum number of cached values.
+    max_bytes (int, optional): Maximum total size of the cached values in bytes.
+    """
+
+    def __init__(self, max_entries=32, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def nbytes(self):
+        """Total size of the cached values in bytes."""
+        return self._nbytes
+
+    def get(self, key, default=None):
+        """Return the cached value for key (marking it as recently used), or default."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, key, value, nbytes=0):
+        """Store value under key, evicting the least recently used entries to stay in bounds."""
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= self._entries.pop(key)[1]
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                return  # Too large to cache at all
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._nbytes > self.max_bytes
+            ):
+                self._nbytes -= self._entries.popitem(last=False)[1][1]
+
+    def clear(self):
+        """Drop every entry and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Return hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self._nbytes}
+
+_MISSING = object()
+
+class CountedFunction:
+    """
+    Wrap a function of one variable to count its evaluations, with an optional bounded memo cache.
+
+    Parameters:
+    f (function): The function to wrap.
+    maxsize (int): Number of distinct arguments to remember; 0 disables memoization.
+
+    Attributes:
+    calls (int): Number of times the wrapper was called.
+    evaluations (int): Number of times f itself was evaluated.
+    """
+
+    def __init__(self, f, maxsize=0):
+        self.f = f
+        self.calls = 0
+        self.evaluations = 0
+        self.cache = LRUCache(max_entries=maxsize) if maxsize else None
+
+    def __call__(self, x):
+        self.calls += 1
+        try:
+            hash(x)
+        except TypeError:
+            cacheable = False  # Arrays are evaluated directly
+        else:
+            cacheable = self.cache is not None
+        if cacheable:
+            value = self.cache.get(x, _MISSING)
+            if value is not _MISSING:
+                return value
+        self.evaluations += 1
+        value = self.f(x)
+        if cacheable:
+            self.cache.put(x, value)
+        return value
+
+    def stats(self):
+        """Return call and evaluation counters."""
+        return {"calls": self.calls, "evaluations": self.evaluations, "cache_hits": self.calls - self.evaluations}
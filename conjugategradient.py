@@ -0,0 +1,176 @@
+import numpy as np
+from gaussseidel import csr_arrays, csr_diagonal, dense_to_csr
+
+def _operator(A):
+    """Return (matvec, diagonal, kind) for a dense array, a CSR matrix or a matvec callable."""
+    if callable(A):
+        return A, None, "matvec"
+    if isinstance(A, np.ndarray):
+        return (lambda x: A @ x), np.diagonal(A).astype(np.float64), "dense"
+    indptr, indices, data = csr_arrays(A)
+    n = len(indptr) - 1
+    rows = np.repeat(np.arange(n), np.diff(indptr))  # Row of every stored entry, computed once
+    matvec = lambda x: np.bincount(rows, weights=data * x[indices], minlength=n)
+    return matvec, csr_diagonal(indptr, indices, data).astype(np.float64), "csr"
+
+def incomplete_cholesky_csr(A):
+    """
+    Zero fill-in incomplete Cholesky factor of a sparse SPD CSR matrix.
+
+    L keeps the sparsity pattern of the lower triangle of A, so A ~= L L^T.
+
+    Returns:
+    tuple: The factor L as CSR arrays (indptr, indices, data), lower triangle only.
+    """
+    indptr, indices, data = csr_arrays(A)
+    n = len(indptr) - 1
+    rows = []  # Row i of L as {column: value}, columns <= i
+    for i in range(n):
+        rows.append({
+            int(j): float(v)
+            for j, v in zip(indices[indptr[i]:indptr[i + 1]], data[indptr[i]:indptr[i + 1]])
+            if j <= i
+        })
+
+    for i in range(n):
+        row = rows[i]
+        for j in sorted(row):
+            # l_ij = (a_ij - sum_k l_ik l_jk) / l_jj over the shared pattern k < j
+            other = rows[j]
+            total = row[j] - sum(value * other[k] for k, value in row.items() if k < j and k in other)
+            if j < i:
+                row[j] = total / other[j]
+            elif total <= 0:
+                raise ValueError("Incomplete Cholesky broke down (non-positive pivot).")
+            else:
+                row[j] = np.sqrt(total)
+
+    L_indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum([len(row) for row in rows], out=L_indptr[1:])
+    L_indices = np.array([j for row in rows for j in sorted(row)], dtype=np.int64)
+    L_data = np.array([row[j] for row in rows for j in sorted(row)])
+    return L_indptr, L_indices, L_data
+
+def _csr_triangular_solves(L_indptr, L_indices, L_data):
+    """Return a function solving (L L^T) z = r for a CSR lower triangular L."""
+    n = len(L_indptr) - 1
+    indptr, indices, data = L_indptr.tolist(), L_indices.tolist(), L_data.tolist()
+    # Columns of L, i.e. rows of L^T, for the backward solve
+    columns = [[] for _ in range(n)]
+    for i in range(n):
+        for k in range(indptr[i], indptr[i + 1]):
+            columns[indices[k]].append((i, data[k]))
+
+    def solve(r):
+        y = r.tolist()
+        for i in range(n):
+            diag = 0.0
+            total = y[i]
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                if j == i:
+                    diag = data[k]
+                else:
+                    total -= data[k] * y[j]
+            y[i] = total / diag
+        for i in range(n - 1, -1, -1):
+            diag = 0.0
+            total = y[i]
+            for j, value in columns[i]:
+                if j == i:
+                    diag = value
+                else:
+                    total -= value * y[j]
+            y[i] = total / diag
+        return np.array(y)
+
+    return solve
+
+def make_preconditioner(A, kind="jacobi"):
+    """
+    Build a preconditioner z = M^-1 r for conjugate_gradient.
+
+    Parameters:
+    A: Dense array or CSR matrix (a matvec callable only supports kind=None).
+    kind (str): "jacobi" (diagonal), "ichol" (zero fill-in incomplete Cholesky) or None.
+
+    Returns:
+    function: Applies M^-1 to a residual vector.
+    """
+    if kind is None:
+        return lambda r: r
+    _, diagonal, operator_kind = _operator(A)
+    if operator_kind == "matvec":
+        raise ValueError("A matrix-free operator needs an explicit preconditioner function.")
+    if kind == "jacobi":
+        if np.any(diagonal <= 0):
+            raise ValueError("The Jacobi preconditioner needs a positive diagonal.")
+        inverse_diagonal = 1.0 / diagonal
+        return lambda r: inverse_diagonal * r
+    if kind == "ichol":
+        # The factor keeps the pattern of A, so dense input goes through CSR as well
+        return _csr_triangular_solves(*incomplete_cholesky_csr(dense_to_csr(A) if operator_kind == "dense" else A))
+    raise ValueError("Preconditioner must be 'jacobi', 'ichol' or None.")
+
+def conjugate_gradient(A, b, initial_guess=None, preconditioner="auto", tol=1e-10, max_iterations=None):
+    """
+    Solve A x = b for a symmetric positive-definite A with preconditioned conjugate gradients.
+
+    Parameters:
+    A: Dense array, CSR matrix ((indptr, indices, data) or an object with those
+    attributes), or a function computing A @ x (matrix-free).
+    b (1D array): Constant vector.
+    initial_guess (1D array): Initial guess for the solution (default is a zero vector).
+    preconditioner: "jacobi", "ichol", None, or a function applying M^-1 to a residual.
+    "auto" (the default) is "jacobi" for a matrix and None for a matvec function.
+    tol (float): Stop when ||r|| <= tol * ||b||.
+    max_iterations (int, optional): Defaults to 10 * n.
+
+    Returns:
+    dict: "solution", "status" ("converged", "max_iterations" or "breakdown"),
+    "iteration_count" and the "residual_history" of ||r|| per iteration.
+    """
+    matvec, _, operator_kind = _operator(A)
+    if preconditioner == "auto":
+        preconditioner = None if operator_kind == "matvec" else "jacobi"
+    b = np.asarray(b, dtype=np.float64)
+    n = len(b)
+    max_iterations = 10 * n if max_iterations is None else max_iterations
+    apply_preconditioner = preconditioner if callable(preconditioner) else make_preconditioner(A, preconditioner)
+
+    x = np.zeros(n) if initial_guess is None else np.array(initial_guess, dtype=np.float64)
+    r = b - matvec(x)
+    z = apply_preconditioner(r)
+    p = z.copy()
+    rz = r @ z
+    threshold = tol * np.linalg.norm(b)
+    history = [np.linalg.norm(r)]
+    status = "max_iterations"
+
+    for _ in range(max_iterations):
+        if history[-1] <= threshold:
+            status = "converged"
+            break
+        Ap = matvec(p)
+        curvature = p @ Ap
+        if curvature <= 0:
+            status = "breakdown"  # A is not positive definite along p
+            break
+        alpha = rz / curvature
+        x += alpha * p
+        r -= alpha * Ap
+        history.append(np.linalg.norm(r))
+        z = apply_preconditioner(r)
+        rz_new = r @ z
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+    else:
+        if history[-1] <= threshold:
+            status = "converged"
+
+    return {
+        "solution": x,
+        "status": status,
+        "iteration_count": len(history) - 1,
+        "residual_history": history
+    }
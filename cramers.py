@@ -1,4 +1,7 @@
+from collections.abc import Mapping, Sequence
+
 import numpy as np
+from LUdecomposition import lu_factorization, lu_factor_batched, lu_solve_batched
 
 def format_number(value):
     """
@@ -39,49 +42,133 @@ def format_matrix(matrix):
     """
     return [[format_number(value) for value in row] for row in matrix]
 
-def cramers(A, b):
+def replaced_column_matrices(A, b):
+    """
+    Build every A_i of Cramer's rule at once.
+
+    Parameters:
+    A (numpy.ndarray): Coefficient matrix, or a stack of them shaped (batch, n, n).
+    b (numpy.ndarray): Constants vector, or a stack shaped (batch, n).
+
+    Returns:
+    numpy.ndarray: Stack shaped (n, n, n), or (batch, n, n, n), whose i-th matrix is A with column i replaced by b.
+    """
+    n = A.shape[-1]
+    columns = np.arange(n)
+    stacked = np.repeat(A[..., None, :, :], n, axis=-3).astype(np.result_type(A, b))
+    # The replaced-column index moves to the front, so b broadcasts along it
+    stacked[..., columns, :, columns] = b[None]
+    return stacked
+
+class CramerSteps(Mapping):
+    """
+    Step-by-step view of Cramer's Rule, read like the dict {"det_A": ..., "matrices": [...]}.
+
+    The A_i matrices and the formatted strings are only built when a step is
+    read, so callers that only want the solution never pay for them.
+    """
+
+    def __init__(self, A, b, det_A, det_Ai, matrices=None):
+        self.A = A
+        self.b = b
+        self.det_A = det_A
+        self.det_Ai = det_Ai
+        self._matrices = matrices
+
+    def __getitem__(self, key):
+        if key == "det_A":
+            return format_number(self.det_A)
+        if key == "matrices":
+            return ReplacedColumnSteps(self)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(("det_A", "matrices"))
+
+    def __len__(self):
+        return 2
+
+    def __repr__(self):
+        return repr({"det_A": self["det_A"], "matrices": list(self["matrices"])})
+
+    def matrix(self, i):
+        """Return A with column i replaced by b."""
+        if self._matrices is not None:
+            return self._matrices[i]
+        Ai = self.A.astype(np.result_type(self.A, self.b))
+        Ai[:, i] = self.b
+        return Ai
+
+class ReplacedColumnSteps(Sequence):
+    """Lazy sequence of the A_i steps of a CramerSteps view."""
+
+    def __init__(self, steps):
+        self.steps = steps
+
+    def __len__(self):
+        return len(self.steps.det_Ai)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("step index out of range")
+        return {
+            "column_replaced": i + 1,
+            "matrix": format_matrix(self.steps.matrix(i)),
+            "det_Ai": format_number(self.steps.det_Ai[i])
+        }
+
+def cramers(A, b, mode="factorization"):
     """
     Solve a system of linear equations using Cramer's Rule with support for complex numbers.
 
     Parameters:
     A (numpy.ndarray): Coefficient matrix (2x2 or 3x3).
     b (numpy.ndarray): Constants vector.
+    mode (str): "factorization" gets det(A) and x from a single LU factorization of A,
+    with det(A_i) = det(A) * x_i. "determinants" evaluates det(A) and every det(A_i)
+    with one batched determinant over the stacked (n + 1, n, n) matrices.
 
     Returns:
-    dict: Solutions for the system and intermediate steps or an error message.
+    dict: Raw "x", "det_A" and "det_Ai", formatted "solutions" and a lazy
+    CramerSteps view of the intermediate steps, or an error message.
     """
     try:
         # Validate input dimensions
         n = A.shape[0]
         if A.shape[1] != n or len(b) != n:
             return {"error": "Matrix A must be square and match the size of vector b."}
-
-        # Compute determinant of A
-        det_A = np.linalg.det(A)
-        if np.isclose(det_A, 0):
-            return {"error": "The determinant of A is zero or very close to zero. The system has no unique solution."}
-
-        solutions = {}
-        steps = {"det_A": format_number(det_A), "matrices": []}
-
-        for i in range(n):
-            # Create Ai by replacing the i-th column of A with b
-            Ai = A.copy()
-            Ai[:, i] = b
-            det_Ai = np.linalg.det(Ai)
-
-            # Store the intermediate matrix and determinant
-            steps["matrices"].append({
-                "column_replaced": i + 1,
-                "matrix": format_matrix(Ai),
-                "det_Ai": format_number(det_Ai)
-            })
-
-            # Calculate solution and format it
-            solution = det_Ai / det_A
-            solutions[f"x{i+1}"] = format_number(solution)
-
-        return {"solutions": solutions, "steps": steps}
+        if mode not in ("factorization", "determinants"):
+            return {"error": f"Unknown mode '{mode}'. Use 'factorization' or 'determinants'."}
+
+        singular_error = {"error": "The determinant of A is zero or very close to zero. The system has no unique solution."}
+        Ai_stack = None  # Only the determinants mode needs the A_i up front
+
+        if mode == "factorization":
+            try:
+                factorization = lu_factorization(A, cache=False)
+            except ValueError:
+                return singular_error
+            det_A = factorization.det()
+            if np.isclose(det_A, 0):
+                return singular_error
+            x = factorization.solve(b)
+            det_Ai = det_A * x
+        else:
+            Ai_stack = replaced_column_matrices(A, b)
+            dets = np.linalg.det(np.concatenate([A[None], Ai_stack]))
+            det_A, det_Ai = dets[0], dets[1:]
+            if np.isclose(det_A, 0):
+                return singular_error
+            x = det_Ai / det_A
+
+        solutions = {f"x{i+1}": format_number(x[i]) for i in range(n)}
+        steps = CramerSteps(A, b, det_A, det_Ai, Ai_stack)
+
+        return {"x": x, "det_A": det_A, "det_Ai": det_Ai, "solutions": solutions, "steps": steps}
 
     except ValueError as e:
         # Handle input validation errors
@@ -90,3 +177,37 @@ def cramers(A, b):
     except Exception as e:
         # Handle unexpected errors gracefully
         return {"error": f"Unexpected computation error: {e}"}
+
+def cramers_batched(A, b, return_matrices=False):
+    """
+    Apply Cramer's Rule to a stack of systems in one vectorized call.
+
+    Parameters:
+    A (numpy.ndarray): Coefficient matrices shaped (batch, n, n).
+    b (numpy.ndarray): Constants vectors shaped (batch, n).
+    return_matrices (bool): Also build the A_i stacks and take det(A_i) from them
+    with a batched determinant instead of det(A) * x_i.
+
+    Returns:
+    dict: Raw arrays "x" (batch, n), "det_A" (batch,), "det_Ai" (batch, n), a
+    "singular" mask (those members get NaN solutions) and, if requested, "matrices".
+    """
+    A = np.asarray(A)
+    b = np.asarray(b)
+    LU, perm, singular = lu_factor_batched(A)
+    n = A.shape[-1]
+
+    # The parity of each row permutation is the parity of its inversion count
+    inversions = np.triu(perm[:, :, None] > perm[:, None, :]).sum(axis=(1, 2))
+    sign = np.where(inversions % 2, -1, 1)
+    det_A = sign * np.prod(np.diagonal(LU, axis1=1, axis2=2), axis=1)
+    x = lu_solve_batched(LU, perm, b, singular)[1]
+
+    result = {"x": x, "det_A": det_A, "singular": singular}
+    if return_matrices:
+        matrices = replaced_column_matrices(A, b)
+        result["matrices"] = matrices
+        result["det_Ai"] = np.linalg.det(matrices)
+    else:
+        result["det_Ai"] = det_A[:, None] * x
+    return result
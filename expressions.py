@@ -0,0 +1,179 @@
+import ast
+import operator
+
+import sympy
+from sympy import lambdify
+from sympy.parsing.sympy_parser import parse_expr
+
+from cache import LRUCache
+
+# Functions and constants an equation may use, by the names users type
+FUNCTIONS = {
+    "sin": sympy.sin, "cos": sympy.cos, "tan": sympy.tan,
+    "sec": sympy.sec, "csc": sympy.csc, "cot": sympy.cot,
+    "asin": sympy.asin, "acos": sympy.acos, "atan": sympy.atan,
+    "sinh": sympy.sinh, "cosh": sympy.cosh, "tanh": sympy.tanh,
+    "exp": sympy.exp, "log": sympy.log, "ln": sympy.log,
+    "sqrt": sympy.sqrt, "abs": sympy.Abs, "Abs": sympy.Abs,
+}
+CONSTANTS = {"pi": sympy.pi, "e": sympy.E, "E": sympy.E, "I": sympy.I}
+
+# Largest constant exponent accepted, whatever the base; sympy folds bases such as x/x*9 to a
+# number and computes the power exactly, so 9**9**9 or (x**0+9)**9**9 would stall the parser
+MAX_EXPONENT = 1000
+
+# Largest size accepted for a constant made only of numbers, e.g. ((9**999)**999)**999
+MAX_CONSTANT = 1e300
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Constant, ast.Load,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.UAdd, ast.USub,
+)
+
+_OPERATORS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.Pow: operator.pow, ast.Mod: operator.mod,
+}
+
+_expression_cache = LRUCache(max_entries=128)
+
+def _variable_names(variables):
+    """Split "x", "x y" or "x, y" into a tuple of names."""
+    return tuple(variables.replace(",", " ").split())
+
+def _constant_value(node):
+    """Magnitude of a subtree made only of numbers, or None if it depends on a name."""
+    if isinstance(node, ast.Constant):
+        return abs(node.value)
+    if isinstance(node, ast.UnaryOp):
+        return _constant_value(node.operand)
+    if isinstance(node, ast.BinOp):
+        left, right = _constant_value(node.left), _constant_value(node.right)
+        if left is None or right is None:
+            return None
+        try:
+            return abs(_OPERATORS[type(node.op)](float(left), float(right)))
+        except (OverflowError, ZeroDivisionError):
+            return float("inf")
+    return None
+
+def _constant_size(node):
+    """
+    Upper bound on max(|v|, 1/|v|) for a subtree made only of numbers, or None if it depends on a name.
+
+    Both the magnitude and its inverse are bounded, since exact integers and
+    rationals grow the same way (10**300 and (1/10)**300).
+    """
+    if isinstance(node, ast.Constant):
+        value = abs(node.value)
+        try:
+            return max(float(value), 1 / float(value)) if value else 1.0
+        except OverflowError:
+            return float("inf")
+    if isinstance(node, ast.UnaryOp):
+        return _constant_size(node.operand)
+    if isinstance(node, ast.BinOp):
+        left, right = _constant_size(node.left), _constant_size(node.right)
+        if left is None or right is None:
+            return None
+        try:
+            if isinstance(node.op, ast.Pow):
+                return left ** right
+            if isinstance(node.op, (ast.Mult, ast.Div)):
+                return left * right
+            return 2 * left * right  # Sums of rationals multiply denominators
+        except OverflowError:
+            return float("inf")
+    return None
+
+def normalize_expression(equation, variables="x"):
+    """
+    Check an equation against the whitelist of allowed syntax and return its canonical text.
+
+    Only numbers, the variables, the names in FUNCTIONS and CONSTANTS,
+    arithmetic operators and calls of whitelisted functions are accepted, so
+    nothing the user types can reach attributes, imports or builtins. "^" is
+    read as a power.
+
+    Parameters:
+    equation (str): The equation as typed by the user.
+    variables (str): Names of the variables, e.g. "x" or "x y".
+
+    Returns:
+    str: The equation with uniform spacing, used as the cache key.
+    """
+    names = _variable_names(variables)
+    tree = ast.parse(equation.strip().replace("^", "**"), mode="eval")
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported syntax in the equation: {type(node).__name__}.")
+        if isinstance(node, ast.Constant) and (
+            isinstance(node.value, bool) or not isinstance(node.value, (int, float, complex))
+        ):
+            raise ValueError(f"Unsupported constant in the equation: {node.value!r}.")
+        if isinstance(node, ast.Call) and (
+            not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords
+        ):
+            raise ValueError(f"Unsupported function call in the equation: {ast.unparse(node)}.")
+        if isinstance(node, ast.Name) and node.id not in FUNCTIONS and node.id not in CONSTANTS and node.id not in names:
+            raise ValueError(f"Unknown name '{node.id}' in the equation; the variables are {', '.join(names)}.")
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            exponent = _constant_value(node.right)
+            if exponent is not None and exponent > MAX_EXPONENT:
+                raise ValueError(f"Exponents larger than {MAX_EXPONENT} are not supported.")
+        if isinstance(node, (ast.BinOp, ast.Constant)):
+            size = _constant_size(node)
+            if size is not None and size > MAX_CONSTANT:
+                raise ValueError(f"Constants larger than {MAX_CONSTANT:g} (or smaller than its inverse) are not supported.")
+
+    return ast.unparse(tree)
+
+def _parse(text, names):
+    """Parse normalized text with sympy, resolving names through the whitelist."""
+    local_dict = {**FUNCTIONS, **CONSTANTS, **{name: sympy.Symbol(name) for name in names}}
+    return parse_expr(text, local_dict=local_dict)
+
+def parse_expression(equation, variables="x"):
+    """
+    Parse a whitelisted equation into a sympy expression.
+
+    Parameters:
+    equation (str): The equation as typed by the user.
+    variables (str): Names of the variables, e.g. "x" or "x y".
+
+    Returns:
+    sympy.Expr: The parsed expression.
+    """
+    names = _variable_names(variables)
+    return _parse(normalize_expression(equation, variables), names)
+
+def compile_expression(equation, variables="x"):
+    """
+    Compile an equation once into a NumPy function of its variables.
+
+    The expression is parsed with sympy, common subexpressions are eliminated
+    and the result is lambdified to NumPy, so the function accepts scalars
+    (real or complex) and arrays alike. Compiled functions are kept in a
+    bounded LRU cache keyed by the normalized equation, so reruns with the
+    same input skip parsing and code generation.
+
+    Parameters:
+    equation (str): The equation as typed by the user.
+    variables (str): Names of the variables, e.g. "x" or "x y".
+
+    Returns:
+    function: f(x) (or f(x, y, ...) for several variables).
+    """
+    names = _variable_names(variables)
+    key = (normalize_expression(equation, variables), names)
+    f = _expression_cache.get(key)
+    if f is None:
+        expression = _parse(*key)
+        f = lambdify([sympy.Symbol(name) for name in names], expression, modules="numpy", cse=True)
+        _expression_cache.put(key, f)
+    return f
+
+def expression_cache_stats():
+    """Return the hit/miss counters and size of the compiled-expression cache."""
+    return _expression_cache.stats()
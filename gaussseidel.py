@@ -1,5 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-def gauss_seidel_fixed_iterations(A, b, initial_guess=None, iterations=10):
+from acceleration import fixed_point
+from cache import LRUCache, matrix_key
+from history import collect
+
+def _sweep(A, b, x, diag):
+    """Perform one Gauss-Seidel sweep over the rows of A, updating x in place."""
+    for i in range(len(b)):
+        # Row dot product, minus the diagonal term, using the most recent values
+        x[i] = (b[i] - A[i] @ x + diag[i] * x[i]) / diag[i]
+
+def _percentage_errors(x, x_old):
+    """Approximate relative errors |(x - x_old) / x| in percent, 0 where x is 0."""
+    errors = np.zeros_like(x)
+    nonzero = x != 0
+    errors[nonzero] = np.abs((x[nonzero] - x_old[nonzero]) / x[nonzero]) * 100
+    return errors
+
+def _diagonal(A):
+    diag = np.diagonal(A).astype(np.float64)
+    if np.any(diag == 0):
+        raise ValueError("Matrix A has a zero on its diagonal. Reorder the equations first.")
+    return diag
+
+def diagonal_dominance(A):
+    """
+    Classify the row diagonal dominance of A.
+
+    Returns:
+    str: "strict" if |a_ii| > sum of |a_ij| (j != i) in every row, "weak" if
+    only >= holds everywhere, and "none" otherwise.
+    """
+    A = np.abs(np.asarray(A))
+    diag = np.diagonal(A)
+    off_diagonal = A.sum(axis=1) - diag
+    if np.all(diag > off_diagonal):
+        return "strict"
+    if np.all(diag >= off_diagonal):
+        return "weak"
+    return "none"
+
+def predict_convergence(A, max_size=500):
+    """
+    Predict whether Gauss-Seidel converges on A before running any sweeps.
+
+    Strict diagonal dominance guarantees convergence. Otherwise, for systems
+    up to max_size unknowns, the spectral radius of the Gauss-Seidel
+    iteration matrix -(D + L)^-1 U decides it.
+
+    Returns:
+    dict: "dominance", "spectral_radius" (None when not computed) and
+    "converges" (True, False, or None when unknown).
+    """
+    A = np.asarray(A, dtype=np.float64)
+    dominance = diagonal_dominance(A)
+    if dominance == "strict":
+        return {"dominance": dominance, "spectral_radius": None, "converges": True}
+    if A.shape[0] > max_size:
+        return {"dominance": dominance, "spectral_radius": None, "converges": None}
+    iteration_matrix = -np.linalg.solve(np.tril(A), np.triu(A, 1))
+    spectral_radius = float(np.abs(np.linalg.eigvals(iteration_matrix)).max())
+    return {"dominance": dominance, "spectral_radius": spectral_radius, "converges": spectral_radius < 1}
+
+def iter_gauss_seidel(A, b, initial_guess=None, iterations=10):
+    """
+    Run a fixed number of Gauss-Seidel sweeps and yield the record of each as it is computed.
+
+    Parameters are as for gauss_seidel_fixed_iterations.
+
+    Yields:
+    dict: Iteration number, x1..xn and the percentage errors Ea1..Ean.
+    """
+    A = np.asarray(A, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    n = len(b)
+    x = np.zeros_like(b, dtype=np.float64) if initial_guess is None else np.array(initial_guess, dtype=np.float64)
+    diag = _diagonal(A)
+
+    for iteration in range(iterations):
+        x_old = x.copy()
+        _sweep(A, b, x, diag)
+
+        # Compute percentage errors for each variable
+        errors = _percentage_errors(x, x_old)
+
+        # Set errors to 100% for the first iteration
+        if iteration == 0:
+            errors[:] = 100
+
+        record = {"Iteration": iteration + 1}
+        record.update({f"x{i + 1}": x[i] for i in range(n)})
+        record.update({f"Ea{i + 1}": errors[i] for i in range(n)})
+        yield record
+
+def gauss_seidel_fixed_iterations(A, b, initial_guess=None, iterations=10, history=None):
     """
     Perform the Gauss-Seidel method with a fixed number of iterations to solve Ax = b.
 
@@ -8,47 +103,447 @@ def gauss_seidel_fixed_iterations(A, b, initial_guess=None, iterations=10):
     b (1D array): Constant vector.
     initial_guess (1D array): Initial guess for the solution (default is a zero vector).
     iterations (int): Number of iterations to perform.
+    history (IterationHistory, optional): Bounded store for the iteration records;
+    by default every record is kept.
 
     Returns:
     dict: Contains the solution and iteration details.
     """
+    iteration_details, last = collect(iter_gauss_seidel(A, b, initial_guess, iterations), history)
+    if last is None:
+        solution = np.zeros(len(b)) if initial_guess is None else np.array(initial_guess, dtype=np.float64)
+    else:
+        solution = np.array([last[f"x{i + 1}"] for i in range(len(b))])
+
+    return {
+        "solution": solution,
+        "iterations": iteration_details
+    }
+
+# Last converged solution per coefficient matrix, keyed by a content hash of A
+_warm_starts = LRUCache(max_entries=64, max_bytes=64 * 2**20)
+
+def _warm_start(key, n):
+    """Return the stored warm-start entry for key if it fits a system of n unknowns."""
+    entry = _warm_starts.get(key)
+    if entry is not None and len(entry["solution"]) == n:
+        return entry
+    return None
+
+def _remember_solution(key, entry, x, iteration_count, prediction=None, cold_start=False):
+    """Store a converged solution; the cold-start sweep count is kept from the first solve started at zero."""
+    cold_iterations = entry["cold_iterations"] if entry is not None else None
+    if cold_iterations is None and cold_start:
+        cold_iterations = iteration_count
+    _warm_starts.put(
+        key,
+        {"solution": np.array(x, dtype=np.float64), "cold_iterations": cold_iterations, "prediction": prediction},
+        len(x) * 8
+    )
+
+def _warm_start_report(entry, iteration_count):
+    """Fields added to a solver result about the warm start."""
+    if entry is None:
+        return {"warm_started": False, "iterations_saved": None}
+    if entry["cold_iterations"] is None:
+        return {"warm_started": True, "iterations_saved": None}  # No zero-start solve to compare with
+    return {"warm_started": True, "iterations_saved": entry["cold_iterations"] - iteration_count}
+
+def gauss_seidel(A, b, initial_guess=None, atol=1e-10, rtol=1e-8, max_iterations=1000, check_convergence=True, warm_start=True, history=None):
+    """
+    Perform the Gauss-Seidel method until the iterates converge.
+
+    Iteration stops when max|x - x_old| <= atol + rtol * max|x|, or after
+    max_iterations sweeps. If check_convergence is set and the iteration is
+    predicted to diverge, no sweeps are run at all.
+
+    With warm_start, the converged solution is remembered per matrix A (in a
+    bounded LRU store), and a later solve with the same A and no
+    initial_guess starts from it.
+
+    Parameters:
+    A (2D array): Coefficient matrix.
+    b (1D array): Constant vector.
+    initial_guess (1D array): Initial guess for the solution (default is a zero vector).
+    atol, rtol (float): Absolute and relative tolerances on the change between sweeps.
+    max_iterations (int): Maximum number of sweeps.
+    check_convergence (bool): Check diagonal dominance / spectral radius first.
+    warm_start (bool): Use and update the warm-start store.
+    history (IterationHistory, optional): Bounded store for the per-sweep records,
+    so memory stays constant for long runs; by default every sweep is kept.
+
+    Returns:
+    dict: "solution", "status" ("converged", "max_iterations", "diverging" or
+    "diverged"), "iteration_count", the convergence "prediction", columnar
+    "iterations" ({"Iteration": [...], "x1": [...], ..., "Ea1": [...], ...}) for any n,
+    "warm_started" and "iterations_saved" compared with the first solve started
+    from zero (None if there was none).
+    """
+    A = np.asarray(A, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
     n = len(b)
-    x = np.zeros_like(b, dtype=np.float64) if initial_guess is None else np.array(initial_guess, dtype=np.float64)
-    iteration_details = []
+    key = matrix_key(A) if warm_start else None
+    stored = _warm_start(key, n) if warm_start else None
+    entry = stored if initial_guess is None else None
+    cold_start = entry is None and (initial_guess is None or not np.any(initial_guess))
+    if entry is not None:
+        x = entry["solution"].copy()
+    else:
+        x = np.zeros(n) if initial_guess is None else np.array(initial_guess, dtype=np.float64)
+    diag = _diagonal(A)
 
-    for iteration in range(iterations):
-        x_old = x.copy()
+    if entry is not None and entry["prediction"] is not None:
+        prediction = entry["prediction"]  # Same A, same prediction
+    else:
+        prediction = predict_convergence(A) if check_convergence else None
+    store = [] if history is None else history
+    iteration_count = 0
+    status = "max_iterations"
 
-        for i in range(n):
-            # Compute the sum for all elements except the current one
-            sigma = sum(A[i][j] * x[j] for j in range(n) if j != i)
-            # Update x[i] using the most recent values
-            x[i] = (b[i] - sigma) / A[i][i]
+    if prediction is not None and prediction["converges"] is False:
+        status = "diverging"
+    else:
+        for iteration in range(max_iterations):
+            x_old = x.copy()
+            _sweep(A, b, x, diag)
+            errors = _percentage_errors(x, x_old) if iteration else np.full(n, 100.0)
+            store.append({"Iteration": iteration + 1, "x": x.copy(), "Ea": errors})
+            iteration_count += 1
 
-        # Compute percentage errors for each variable
-        errors = np.zeros_like(x)
-        for i in range(n):
-            if x[i] != 0:  # Avoid division by zero
-                errors[i] = abs((x[i] - x_old[i]) / x[i]) * 100
-            else:
-                errors[i] = 0
+            if not np.all(np.isfinite(x)):
+                status = "diverged"
+                break
+            if np.abs(x - x_old).max() <= atol + rtol * np.abs(x).max():
+                status = "converged"
+                break
 
-        # Set errors to 100% for the first iteration
-        if iteration == 0:
-            errors[:] = 100
+    kept = list(store)
+    X = np.array([record["x"] for record in kept]).reshape(-1, n)
+    E = np.array([record["Ea"] for record in kept]).reshape(-1, n)
+    iterations = {"Iteration": np.array([record["Iteration"] for record in kept], dtype=int)}
+    iterations.update({f"x{i + 1}": X[:, i] for i in range(n)})
+    iterations.update({f"Ea{i + 1}": E[:, i] for i in range(n)})
+    if warm_start and status == "converged":
+        _remember_solution(key, stored, x, iteration_count, prediction, cold_start)
+
+    return {
+        "solution": x,
+        "status": status,
+        "iteration_count": iteration_count,
+        "prediction": prediction,
+        "iterations": iterations,
+        **_warm_start_report(entry, iteration_count)
+    }
+
+def csr_arrays(A):
+    """
+    Return (indptr, indices, data) of a CSR matrix.
+
+    A can be such a tuple or any object with indptr, indices and data
+    attributes (for example a scipy.sparse.csr_matrix).
+    """
+    if hasattr(A, "indptr"):
+        return np.asarray(A.indptr), np.asarray(A.indices), np.asarray(A.data)
+    indptr, indices, data = A
+    return np.asarray(indptr), np.asarray(indices), np.asarray(data)
+
+def dense_to_csr(A):
+    """Convert a dense matrix to CSR arrays (indptr, indices, data)."""
+    A = np.asarray(A)
+    rows, cols = np.nonzero(A)
+    indptr = np.zeros(A.shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=A.shape[0]), out=indptr[1:])
+    return indptr, cols, A[rows, cols]
+
+def csr_diagonal(indptr, indices, data):
+    """Return the diagonal of a square CSR matrix."""
+    n = len(indptr) - 1
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    on_diagonal = rows == indices
+    diag = np.zeros(n, dtype=data.dtype)
+    np.add.at(diag, rows[on_diagonal], data[on_diagonal])
+    return diag
+
+def csr_matvec(indptr, indices, data, x):
+    """Multiply a CSR matrix by a vector in O(nnz)."""
+    n = len(indptr) - 1
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    return np.bincount(rows, weights=data * x[indices], minlength=n)
+
+def _sor_sweep_csr(indptr, indices, data, diag, b, x, omega, rows):
+    """One SOR sweep over the given rows; all arguments are plain Python lists for speed."""
+    change = 0.0
+    for i in rows:
+        sigma = 0.0
+        for k in range(indptr[i], indptr[i + 1]):
+            sigma += data[k] * x[indices[k]]
+        # sigma includes the diagonal term, so this is x_i + omega * (GS update - x_i)
+        step = omega * (b[i] - sigma) / diag[i]
+        x[i] += step
+        change = max(change, abs(step))
+    return change
 
-        # Store details of this iteration
-        iteration_details.append({
-            "Iteration": iteration + 1,
-            "x1": x[0],
-            "x2": x[1],
-            "x3": x[2] if n == 3 else None,
-            "Ea1": errors[0],
-            "Ea2": errors[1],
-            "Ea3": errors[2] if n == 3 else None,
-        })
+def gauss_seidel_csr(A, b, initial_guess=None, omega=1.0, symmetric=False, atol=1e-10, rtol=1e-8, max_iterations=1000, warm_start=True):
+    """
+    Perform Gauss-Seidel / SOR sweeps on a sparse CSR matrix in O(nnz) per sweep.
+
+    Warm starts work as in gauss_seidel, keyed by the CSR arrays of A.
+
+    Parameters:
+    A: CSR matrix as (indptr, indices, data) or an object with those attributes.
+    b (1D array): Constant vector.
+    initial_guess (1D array): Initial guess for the solution (default is a zero vector).
+    omega (float): Relaxation factor; 1 is Gauss-Seidel, 1 < omega < 2 over-relaxes.
+    symmetric (bool): Follow every forward sweep by a backward sweep (SSOR).
+    atol, rtol (float): Absolute and relative tolerances on the change between sweeps.
+    max_iterations (int): Maximum number of sweeps.
+    warm_start (bool): Use and update the warm-start store.
+
+    Returns:
+    dict: "solution", "status" ("converged", "max_iterations" or "diverged"),
+    "iteration_count", the largest change of each sweep in "changes",
+    "warm_started" and "iterations_saved".
+    """
+    if not 0 < omega < 2:
+        raise ValueError("The relaxation factor omega must be between 0 and 2.")
+    indptr, indices, data = csr_arrays(A)
+    b = np.asarray(b, dtype=np.float64)
+    n = len(b)
+    diag = csr_diagonal(indptr, indices, data).astype(np.float64)
+    if np.any(diag == 0):
+        raise ValueError("Matrix A has a zero on its diagonal. Reorder the equations first.")
+
+    key = "".join(matrix_key(array) for array in (indptr, indices, data)) if warm_start else None
+    stored = _warm_start(key, n) if warm_start else None
+    entry = stored if initial_guess is None else None
+    cold_start = entry is None and (initial_guess is None or not np.any(initial_guess))
+    if entry is not None:
+        x = entry["solution"].tolist()
+    else:
+        x = [0.0] * n if initial_guess is None else [float(v) for v in initial_guess]
+    arrays = (indptr.tolist(), indices.tolist(), data.tolist(), diag.tolist(), b.tolist())
+    forward = range(n)
+    backward = range(n - 1, -1, -1)
+    changes = []
+    status = "max_iterations"
+
+    for _ in range(max_iterations):
+        change = _sor_sweep_csr(*arrays, x, omega, forward)
+        if symmetric:
+            change = max(change, _sor_sweep_csr(*arrays, x, omega, backward))
+        changes.append(change)
+
+        if not np.isfinite(change):
+            status = "diverged"
+            break
+        if change <= atol + rtol * max(map(abs, x)):
+            status = "converged"
+            break
+
+    if warm_start and status == "converged":
+        _remember_solution(key, stored, x, len(changes), cold_start=cold_start)
+
+    return {
+        "solution": np.array(x),
+        "status": status,
+        "iteration_count": len(changes),
+        "changes": changes,
+        **_warm_start_report(entry, len(changes))
+    }
+
+def greedy_coloring(A):
+    """
+    Color the unknowns so that no two of the same color are coupled by an entry of A.
+
+    Rows of one color can then be updated together in a Gauss-Seidel sweep.
+    Greedy coloring in natural order gives the red-black ordering for the
+    usual 5-point stencil.
+
+    Parameters:
+    A: CSR matrix as (indptr, indices, data), an object with those attributes, or a dense array.
+
+    Returns:
+    ndarray: The color (0, 1, ...) of every row.
+    """
+    if isinstance(A, np.ndarray):
+        A = dense_to_csr(A)
+    indptr, indices, _ = csr_arrays(A)
+    n = len(indptr) - 1
+
+    # Couplings in either direction count, so color the symmetrized pattern
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    pairs = np.concatenate([np.stack([rows, indices]), np.stack([indices, rows])], axis=1)
+    pairs = pairs[:, pairs[0] != pairs[1]]
+    order = np.argsort(pairs[0], kind="stable")
+    neighbors = pairs[1, order].tolist()
+    starts = np.searchsorted(pairs[0, order], np.arange(n + 1)).tolist()
+
+    colors = [-1] * n
+    for i in range(n):
+        taken = {colors[j] for j in neighbors[starts[i]:starts[i + 1]]}
+        color = 0
+        while color in taken:
+            color += 1
+        colors[i] = color
+    return np.array(colors)
+
+def _row_blocks(indptr, indices, data, rows, parts):
+    """Split rows into at most parts blocks, each carrying the CSR entries of its rows."""
+    blocks = []
+    for chunk in np.array_split(rows, max(1, min(parts, len(rows)))):
+        counts = indptr[chunk + 1] - indptr[chunk]
+        first = np.cumsum(counts) - counts
+        entries = np.repeat(indptr[chunk] - first, counts) + np.arange(counts.sum())
+        local = np.repeat(np.arange(len(chunk)), counts)
+        blocks.append((chunk, local, indices[entries], data[entries]))
+    return blocks
+
+def _relaxation_steps(block, x, b, diag, omega):
+    """Return the rows of a block and omega times their Jacobi corrections for the current x."""
+    rows, local, cols, vals = block
+    residual = b[rows] - np.bincount(local, weights=vals * x[cols], minlength=len(rows))
+    return rows, omega * residual / diag[rows]
+
+def _iterate_blocks(groups, x, b, diag, omega, atol, rtol, max_iterations, workers):
+    """
+    Run sweeps where each group of blocks is relaxed from the same x, then applied.
+
+    Returns the status and the largest change of each sweep.
+    """
+    executor = ThreadPoolExecutor(max_workers=workers) if workers and workers > 1 else None
+    changes = []
+    status = "max_iterations"
+    try:
+        for _ in range(max_iterations):
+            change = 0.0
+            for blocks in groups:
+                if executor is None:
+                    results = [_relaxation_steps(block, x, b, diag, omega) for block in blocks]
+                else:
+                    results = list(executor.map(lambda block: _relaxation_steps(block, x, b, diag, omega), blocks))
+                for rows, step in results:
+                    x[rows] += step
+                    if len(step):
+                        change = max(change, float(np.abs(step).max()))
+            changes.append(change)
+
+            if not np.isfinite(change):
+                status = "diverged"
+                break
+            if change <= atol + rtol * np.abs(x).max():
+                status = "converged"
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return status, changes
+
+def multicolor_gauss_seidel(A, b, initial_guess=None, omega=1.0, colors=None, workers=None, atol=1e-10, rtol=1e-8, max_iterations=1000):
+    """
+    Perform Gauss-Seidel / SOR in multicolor order, updating all rows of a color at once.
+
+    Rows of one color do not depend on each other, so each color is a single
+    vectorized step, split into blocks that run on a thread pool when
+    workers > 1. For red-black colorable matrices this converges like
+    Gauss-Seidel in red-black order.
+
+    Parameters:
+    A: CSR matrix as (indptr, indices, data), an object with those attributes, or a dense array.
+    b (1D array): Constant vector.
+    initial_guess (1D array): Initial guess for the solution (default is a zero vector).
+    omega (float): Relaxation factor; 1 is Gauss-Seidel.
+    colors (1D array, optional): Precomputed coloring, e.g. from greedy_coloring.
+    workers (int, optional): Threads per color; None or 1 runs serially.
+    atol, rtol (float): Absolute and relative tolerances on the change between sweeps.
+    max_iterations (int): Maximum number of sweeps.
+
+    Returns:
+    dict: "solution", "status", "iteration_count", "changes" and "color_count".
+    """
+    if isinstance(A, np.ndarray):
+        A = dense_to_csr(A)
+    indptr, indices, data = csr_arrays(A)
+    b = np.asarray(b, dtype=np.float64)
+    n = len(b)
+    diag = csr_diagonal(indptr, indices, data).astype(np.float64)
+    if np.any(diag == 0):
+        raise ValueError("Matrix A has a zero on its diagonal. Reorder the equations first.")
+    if colors is None:
+        colors = greedy_coloring((indptr, indices, data))
+
+    x = np.zeros(n) if initial_guess is None else np.array(initial_guess, dtype=np.float64)
+    parts = workers or 1
+    groups = [
+        _row_blocks(indptr, indices, data, np.flatnonzero(colors == color), parts)
+        for color in range(int(colors.max()) + 1)
+    ]
+    status, changes = _iterate_blocks(groups, x, b, diag, omega, atol, rtol, max_iterations, workers)
 
     return {
         "solution": x,
-        "iterations": iteration_details
+        "status": status,
+        "iteration_count": len(changes),
+        "changes": changes,
+        "color_count": len(groups)
+    }
+
+def weighted_jacobi(A, b, initial_guess=None, weight=2 / 3, workers=None, atol=1e-10, rtol=1e-8, max_iterations=1000):
+    """
+    Perform weighted Jacobi iterations, x <- x + weight * D^-1 (b - A x).
+
+    Every row is updated from the previous iterate, so each sweep is fully
+    vectorized; it is here mainly as a baseline for the multicolor solver.
+
+    Parameters are as for multicolor_gauss_seidel, with the damping weight in place of omega.
+
+    Returns:
+    dict: "solution", "status", "iteration_count" and "changes".
+    """
+    if isinstance(A, np.ndarray):
+        A = dense_to_csr(A)
+    indptr, indices, data = csr_arrays(A)
+    b = np.asarray(b, dtype=np.float64)
+    n = len(b)
+    diag = csr_diagonal(indptr, indices, data).astype(np.float64)
+    if np.any(diag == 0):
+        raise ValueError("Matrix A has a zero on its diagonal. Reorder the equations first.")
+
+    x = np.zeros(n) if initial_guess is None else np.array(initial_guess, dtype=np.float64)
+    groups = [_row_blocks(indptr, indices, data, np.arange(n), workers or 1)]
+    status, changes = _iterate_blocks(groups, x, b, diag, weight, atol, rtol, max_iterations, workers)
+
+    return {
+        "solution": x,
+        "status": status,
+        "iteration_count": len(changes),
+        "changes": changes
     }
+
+def gauss_seidel_accelerated(A, b, initial_guess=None, method="anderson", depth=5, atol=1e-10, rtol=1e-8, max_iterations=1000, baseline=False):
+    """
+    Perform Gauss-Seidel with Anderson or Aitken acceleration of the sweeps.
+
+    Parameters:
+    A (2D array): Coefficient matrix.
+    b (1D array): Constant vector.
+    initial_guess (1D array): Initial guess for the solution (default is a zero vector).
+    method (str): "anderson", "aitken" or None for plain sweeps.
+    depth (int): History depth of Anderson mixing.
+    atol, rtol (float): Absolute and relative tolerances on the change of a sweep.
+    max_iterations (int): Maximum number of sweeps.
+    baseline (bool): Also run unaccelerated sweeps to report the sweeps saved.
+
+    Returns:
+    dict: As returned by acceleration.fixed_point, where iterations are sweeps.
+    """
+    A = np.asarray(A, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    diag = _diagonal(A)
+    x0 = np.zeros(len(b)) if initial_guess is None else np.array(initial_guess, dtype=np.float64)
+
+    def sweep(x):
+        x = x.copy()
+        _sweep(A, b, x, diag)
+        return x
+
+    return fixed_point(sweep, x0, method=method, depth=depth, atol=atol, rtol=rtol, max_iterations=max_iterations, baseline=baseline)
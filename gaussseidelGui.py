@@ -1,11 +1,12 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-from gaussseidel import gauss_seidel_fixed_iterations
+from gaussseidel import gauss_seidel, gauss_seidel_fixed_iterations
+from conjugategradient import conjugate_gradient
 
 def gauss_seidel_app():
     st.header("Gauss-Seidel Method Solver")
-    st.write("This app solves 2x2 or 3x3 systems of linear equations using the Gauss-Seidel method with a fixed number of iterations.")
+    st.write("This app solves n x n systems of linear equations using the Gauss-Seidel method, for a fixed number of iterations or until convergence.")
 
     # Input for the coefficient matrix (A)
     A_input = st.text_area(
@@ -23,20 +24,32 @@ def gauss_seidel_app():
 
     # Initial guess
     initial_guess_input = st.text_input(
-        "Enter the initial guess (optional, default is zero):",
-        value="0,0,0",
-        help="Enter the initial guess as a comma-separated list (e.g., 0,0,0)."
+        "Enter the initial guess (optional):",
+        value="",
+        placeholder="0,0,0",
+        help="Enter the initial guess as a comma-separated list (e.g., 0,0,0). "
+             "Leave empty to start from zero, or from the last solution found for the same matrix."
     )
 
-    # Input for the number of iterations
-    iterations = st.number_input("Enter the number of iterations:", value=10, step=1)
+    # Solver engine; conjugate gradients needs a symmetric positive-definite A
+    engine = st.selectbox("Solver:", ["Gauss-Seidel", "Preconditioned Conjugate Gradient (symmetric positive-definite A)"])
+    if engine == "Gauss-Seidel":
+        mode = st.selectbox("Stopping rule:", ["Fixed number of iterations", "Until convergence"])
+    else:
+        mode = "Until convergence"
+        preconditioner = st.selectbox("Preconditioner:", ["Jacobi", "Incomplete Cholesky", "None"])
+    if mode == "Fixed number of iterations":
+        iterations = st.number_input("Enter the number of iterations:", value=10, step=1)
+    else:
+        tolerance = st.number_input("Tolerance:", value=1e-8, format="%e")
+        iterations = st.number_input("Maximum number of iterations:", value=1000, step=1)
 
-    if st.button("Solve with Gauss-Seidel Method"):
+    if st.button(f"Solve with {engine.split(' (')[0]}"):
         try:
             # Parse inputs
             A = np.array([[float(num) for num in row.split()] for row in A_input.strip().split("\n")])
             b = np.array([float(num) for num in b_input.strip().split("\n")])
-            initial_guess = [float(num) for num in initial_guess_input.split(",")]
+            initial_guess = [float(num) for num in initial_guess_input.split(",")] if initial_guess_input.strip() else None
 
             # Validate input dimensions
             if A.shape[0] != A.shape[1]:
@@ -44,8 +57,41 @@ def gauss_seidel_app():
             if len(b) != A.shape[0]:
                 raise ValueError("Vector b must have the same number of rows as matrix A.")
 
+            if initial_guess is not None and len(initial_guess) != len(b):
+                raise ValueError("The initial guess must have one value per unknown.")
+
+            if engine != "Gauss-Seidel":
+                kind = {"Jacobi": "jacobi", "Incomplete Cholesky": "ichol", "None": None}[preconditioner]
+                result = conjugate_gradient(A, b, initial_guess, preconditioner=kind, tol=tolerance, max_iterations=int(iterations))
+                if result["status"] == "converged":
+                    st.success(f"Conjugate Gradient converged in {result['iteration_count']} iterations!")
+                else:
+                    st.warning(f"Stopped without converging ({result['status']}) after {result['iteration_count']} iterations.")
+                st.write("Solution:")
+                for i, value in enumerate(result["solution"]):
+                    st.write(f"x{i + 1} = {value:.6f}")
+
+                # Display residual history
+                st.write("### Residual History:")
+                st.dataframe(pd.DataFrame({"Iteration": range(len(result["residual_history"])), "||r||": result["residual_history"]}))
+                return
+
             # Solve using Gauss-Seidel
-            result = gauss_seidel_fixed_iterations(A, b, initial_guess, iterations)
+            if mode == "Fixed number of iterations":
+                result = gauss_seidel_fixed_iterations(A, b, initial_guess, iterations)
+            else:
+                result = gauss_seidel(A, b, initial_guess, atol=tolerance, rtol=tolerance, max_iterations=int(iterations))
+                prediction = result["prediction"]
+                if result["status"] == "diverging":
+                    st.error(
+                        f"Gauss-Seidel will not converge for this matrix "
+                        f"(spectral radius {prediction['spectral_radius']:.4f} >= 1). Try reordering the equations."
+                    )
+                    return
+                if result["status"] != "converged":
+                    st.warning(f"Stopped without converging ({result['status']}) after {result['iteration_count']} iterations.")
+                if result["warm_started"]:
+                    st.info(f"Started from the previous solution for this matrix, saving {result['iterations_saved']} iterations.")
 
             # Extract results
             solution = result["solution"]
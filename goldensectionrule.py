@@ -1,56 +1,102 @@
 import streamlit as st
-from sympy import symbols, sympify, lambdify
 import pandas as pd
-
-def golden_section_fixed_iterations(f, xl, xu, iterations, find_max=True):
-    phi = 0.618  # Golden ratio constant
-    table = []
-
-    for i in range(iterations):
-        d = phi * (xu - xl)
-        x1 = xl + d
-        x2 = xu - d
-
-        # Ensure numerical evaluation
-        fx1 = f(x1)
-        fx2 = f(x2)
-
-        # Store iteration details
-        table.append({
+import math
+from cache import CountedFunction
+from expressions import compile_expression
+from history import collect
+
+# Exact golden ratio conjugate, (sqrt(5) - 1) / 2 = 0.6180339887...
+PHI = (math.sqrt(5) - 1) / 2
+
+def iter_golden_section(f, xl, xu, find_max=True, tol=1e-8, max_iterations=100):
+    """
+    Run the Golden Section Rule and yield the record of each iteration as it is computed.
+
+    One interior point is reused from the previous iteration, so every
+    iteration needs exactly one new function evaluation. Iteration stops
+    once the bracket is no wider than tol, or after max_iterations.
+
+    Returns (as the generator's return value):
+    tuple: (x_opt, f_opt, converged) for the better of the final interior points.
+    """
+    d = PHI * (xu - xl)
+    x1 = xl + d
+    x2 = xu - d
+    fl, fu, fx1, fx2 = f(xl), f(xu), f(x1), f(x2)
+
+    for i in range(max_iterations):
+        if xu - xl <= tol:
+            break
+        yield {
             "Iteration": i + 1,
             "xl": xl,
-            "f(xl)": f(xl),
+            "f(xl)": fl,
             "x2": x2,
             "f(x2)": fx2,
             "x1": x1,
             "f(x1)": fx1,
             "xu": xu,
-            "f(xu)": f(xu),
+            "f(xu)": fu,
             "d": d
-        })
-
-        # Update bounds based on optimization goal
-        if find_max:
-            if fx1 > fx2:  # Compare numerical values
-                x1 = x2
-            else:
-                xu = x1
-        else:  # Minimization
-            if fx1 < fx2:  # Compare numerical values
-                xl = x2
-            else:
-                xu = x1
-
-    # Determine optimal point
-    x_opt = (xu + xl) / 2
-    f_opt = f(x_opt)
+        }
+
+        # Keep the side of the bracket that holds the better interior point
+        if (fx1 > fx2) if find_max else (fx1 < fx2):
+            xl, fl = x2, fx2
+            x2, fx2 = x1, fx1
+            d = PHI * (xu - xl)
+            x1 = xl + d
+            fx1 = f(x1)
+        else:
+            xu, fu = x1, fx1
+            x1, fx1 = x2, fx2
+            d = PHI * (xu - xl)
+            x2 = xu - d
+            fx2 = f(x2)
+
+    # The best point evaluated so far is one of the two interior points
+    better = (fx1 > fx2) if find_max else (fx1 < fx2)
+    x_opt, f_opt = (x1, fx1) if better else (x2, fx2)
+    return x_opt, f_opt, xu - xl <= tol
+
+def golden_section_search(f, xl, xu, find_max=True, tol=1e-8, max_iterations=100, history=None):
+    """
+    Find the maximum or minimum of a unimodal f on [xl, xu] by golden-section search.
+
+    Parameters:
+    f (function): The function to optimize.
+    xl, xu (float): Lower and upper bounds of the bracket.
+    find_max (bool): Maximize if True, otherwise minimize.
+    tol (float): Stop once the bracket is no wider than tol.
+    max_iterations (int): Maximum number of iterations.
+    history (IterationHistory, optional): Bounded store for the iteration records;
+    by default every record is kept.
+
+    Returns:
+    dict: "iterations" table, optimum "x_opt" and "f_opt", the number of
+    function "evaluations" and whether the tolerance was reached ("converged").
+    """
+    counted_f = CountedFunction(f)
+    outcome = {}
+
+    def records():
+        outcome["optimum"] = yield from iter_golden_section(counted_f, xl, xu, find_max, tol, max_iterations)
+
+    table, _ = collect(records(), history)
+    x_opt, f_opt, converged = outcome["optimum"]
 
     return {
         "iterations": table,
         "x_opt": x_opt,
-        "f_opt": f_opt
+        "f_opt": f_opt,
+        "evaluations": counted_f.evaluations,
+        "converged": converged
     }
 
+def golden_section_fixed_iterations(f, xl, xu, iterations, find_max=True, history=None):
+    """Run exactly the given number of golden-section iterations (no tolerance stop)."""
+    return golden_section_search(f, xl, xu, find_max, tol=0, max_iterations=iterations, history=history)
+
 def golden_section_app():
     st.header("Golden Section Rule Solver")
     st.write("This app performs the Golden Section Rule to find the maximum or minimum of a function.")
@@ -65,18 +111,17 @@ def golden_section_app():
     # Input for xl, xu, and number of iterations
     xl = st.number_input("Enter the lower bound (xl):", value=0.0)
     xu = st.number_input("Enter the upper bound (xu):", value=2.0)
-    iterations = st.number_input("Enter the number of iterations:", value=10, step=1, min_value=1)
+    tolerance = st.number_input("Tolerance on the bracket width:", value=1e-6, format="%e")
+    iterations = st.number_input("Maximum number of iterations:", value=100, step=1, min_value=1)
     find_max = st.selectbox("Optimization Goal:", ["Find Maximum", "Find Minimum"]) == "Find Maximum"
 
     if st.button("Solve with Golden Section Rule"):
         try:
             # Convert the function to a callable numerical function
-            x = symbols('x')  # Symbol for x
-            symbolic_f = sympify(equation)  # Parse the equation
-            f = lambdify(x, symbolic_f, modules=["numpy"])  # Convert to numerical function
+            f = compile_expression(equation)  # Parse once and convert to a numerical function
 
             # Perform the Golden Section Rule
-            result = golden_section_fixed_iterations(f, xl, xu, iterations, find_max)
+            result = golden_section_search(f, xl, xu, find_max, tol=tolerance, max_iterations=int(iterations))
 
             # Extract results
             iteration_table = result["iterations"]
@@ -87,6 +132,9 @@ def golden_section_app():
             st.success("Golden Section Rule Completed!")
             st.write(f"Optimal x: {x_opt}")
             st.write(f"Optimal f(x): {f_opt}")
+            st.write(f"Function evaluations: {result['evaluations']}")
+            if not result["converged"]:
+                st.warning("The maximum number of iterations was reached before the tolerance.")
 
             # Display iteration table
             st.write("### Iteration Details:")
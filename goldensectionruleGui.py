@@ -1,7 +1,7 @@
 import streamlit as st
-from sympy import sympify, lambdify
+from expressions import compile_expression
 import pandas as pd
-from goldensectionrule import golden_section_fixed_iterations
+from goldensectionrule import golden_section_search
 
 def golden_section_app():
     st.header("Golden Section Rule Solver")
@@ -17,16 +17,17 @@ def golden_section_app():
     # Input for xl, xu, number of iterations, and optimization type
     xl = st.number_input("Enter the lower bound (xl):", value=0.0)
     xu = st.number_input("Enter the upper bound (xu):", value=2.0)
-    iterations = st.number_input("Enter the number of iterations:", value=10, step=1, min_value=1)
+    tolerance = st.number_input("Tolerance on the bracket width:", value=1e-6, format="%e")
+    iterations = st.number_input("Maximum number of iterations:", value=100, step=1, min_value=1)
     find_max = st.selectbox("Optimization Goal:", ["Find Maximum", "Find Minimum"]) == "Find Maximum"
 
     if st.button("Solve with Golden Section Rule"):
         try:
             # Convert the function to a callable form
-            f = lambdify("x", sympify(equation))
+            f = compile_expression(equation)
 
             # Perform the Golden Section Rule
-            result = golden_section_fixed_iterations(f, xl, xu, iterations, find_max)
+            result = golden_section_search(f, xl, xu, find_max, tol=tolerance, max_iterations=int(iterations))
 
             # Extract results
             iteration_table = result["iterations"]
@@ -37,6 +38,9 @@ def golden_section_app():
             st.success("Golden Section Rule Completed!")
             st.write(f"Optimal x: {x_opt}")
             st.write(f"Optimal f(x): {f_opt}")
+            st.write(f"Function evaluations: {result['evaluations']}")
+            if not result["converged"]:
+                st.warning("The maximum number of iterations was reached before the tolerance.")
 
             # Display iteration table
             st.write("### Iteration Details:")
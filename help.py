@@ -14,7 +14,7 @@ def display_help():
           Example: `2 * x`
         - **Division:** Use `/`.  
           Example: `x / 4`
-        - **Powers:** Use `**`.  
+        - **Powers:** Use `**` (or `^`).  
           Example: `x**2` for \(x^2\)
 
         #### Supported Functions:
@@ -26,6 +26,10 @@ def display_help():
         - **Exponential:** Use `exp(x)` for \( e^x \).  
         - **Logarithm:** Use `log(x)` for natural log (\( \\ln(x) \)).
 
+        #### Constants:
+        - `pi` for \( \pi \), `e` (or `E`) for Euler's number and `I` for the imaginary unit.  
+          Only numbers, `x`, these constants and the functions above are accepted.
+
         #### Angle Inputs:
         - Angles are in **radians** by default.  
           To use degrees, convert to radians using \( \\text{radians} = \\text{degrees} \\cdot \\frac{\\pi}{180} \):  
@@ -0,0 +1,110 @@
+from collections import deque
+
+import numpy as np
+
+class IterationHistory:
+    """
+    Bounded record of an iteration: keeps the first head and the last tail records.
+
+    Memory stays constant however many iterations run; total counts every
+    record appended, including the ones dropped from the middle.
+
+    Parameters:
+    head (int): Number of leading records to keep.
+    tail (int): Number of trailing records to keep.
+    """
+
+    def __init__(self, head=100, tail=100):
+        self.head = head
+        self.total = 0
+        self._head = []
+        self._tail = deque(maxlen=tail)
+
+    def append(self, record):
+        self.total += 1
+        if len(self._head) < self.head:
+            self._head.append(record)
+        else:
+            self._tail.append(record)
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+        return self
+
+    @property
+    def dropped(self):
+        """Number of records discarded between the head and the tail."""
+        return self.total - len(self)
+
+    def __len__(self):
+        return len(self._head) + len(self._tail)
+
+    def __iter__(self):
+        yield from self._head
+        yield from self._tail
+
+    def records(self):
+        """Return the kept records, oldest first."""
+        return list(self)
+
+class StructuredHistory(IterationHistory):
+    """
+    Bounded iteration record stored in preallocated NumPy structured arrays.
+
+    Records are dicts whose keys are the fields of dtype; a field missing
+    from a record, or set to None, is stored as NaN.
+
+    Parameters:
+    dtype (np.dtype or list): Structured dtype, e.g. [("Iteration", int), ("x", float)].
+    head (int): Number of leading records to keep.
+    tail (int): Number of trailing records to keep (in a ring buffer).
+    """
+
+    def __init__(self, dtype, head=100, tail=100):
+        super().__init__(head, tail)
+        self.dtype = np.dtype(dtype)
+        self._head = np.zeros(head, dtype=self.dtype)
+        self._tail = np.zeros(tail, dtype=self.dtype)
+        self._head_count = 0
+        self._tail_count = 0
+
+    def _store(self, array, index, record):
+        for name in self.dtype.names:
+            value = record.get(name)
+            array[index][name] = np.nan if value is None else value
+
+    def append(self, record):
+        self.total += 1
+        if self._head_count < len(self._head):
+            self._store(self._head, self._head_count, record)
+            self._head_count += 1
+        elif len(self._tail):
+            self._store(self._tail, self._tail_count % len(self._tail), record)
+            self._tail_count += 1
+
+    def __len__(self):
+        return self._head_count + min(self._tail_count, len(self._tail))
+
+    def to_array(self):
+        """Return the kept records as one structured array, oldest first."""
+        tail = np.roll(self._tail, -self._tail_count)[-min(self._tail_count, len(self._tail)):] if self._tail_count else self._tail[:0]
+        return np.concatenate([self._head[:self._head_count], tail])
+
+    def __iter__(self):
+        for row in self.to_array():
+            yield {name: row[name].item() for name in self.dtype.names}
+
+def collect(records, history=None):
+    """
+    Drain a stream of iteration records into history (or a plain list).
+
+    Returns:
+    tuple: (kept records, last record) so callers can read the final state.
+    """
+    store = [] if history is None else history
+    last = None
+    for record in records:
+        store.append(record)
+        last = record
+    return list(store), last
@@ -1,6 +1,72 @@
 import numpy as np
+from cache import CountedFunction
+from history import collect
+from secant import CONVERGED, MAX_ITERATIONS, DEGENERATE, NONFINITE
 
-def muller(f, x0, x1, x2, max_iter=10, true_root=None):
+def format_number(num):
+    """
+    Converts a complex number to formatted string with 3 decimal places.
+    Replaces `j` with `i` for complex numbers.
+    """
+    if np.isclose(num.imag, 0):  # Check if it's approximately real
+        return f"{num.real:.3f}"  # Format real part
+    return f"{num:.3f}".replace("j", "i")  # Format complex number with small 'i'
+
+def iter_muller(f, x0, x1, x2, max_iter=10, true_root=None):
+    """
+    Run the Muller method and yield the formatted values of each iteration as they are computed.
+
+    Parameters are as for muller.
+
+    Yields:
+    dict: Intermediate values of one iteration.
+    """
+    # Function values are carried between iterations, so each step costs one evaluation
+    f0, f1, f2 = f(x0), f(x1), f(x2)
+
+    for i in range(max_iter):
+        h0 = x1 - x0
+        h1 = x2 - x1
+        s0 = (f1 - f0) / h0
+        s1 = (f2 - f1) / h1
+
+        a = (s1 - s0) / (h1 + h0)
+        b = a * h1 + s1
+        c = f2
+
+        discriminant = np.sqrt(b**2 - 4 * a * c)
+        x3 = x2 - (2 * c) / (b + np.sign(b.real) * discriminant)
+        fx3 = f(x3)
+
+        # Calculate errors
+        Ea = None
+        Et = None
+        if i > 0:  # Ea can only be calculated after the first iteration
+            Ea = abs((x3 - x2) / x3) * 100
+        if true_root is not None:  # Et requires a known true root
+            Et = abs((true_root - x3) / true_root) * 100
+
+        # Yield all calculated values for this iteration
+        yield {
+            "iteration": i + 1,
+            "h0": format_number(h0),
+            "h1": format_number(h1),
+            "s0": format_number(s0),
+            "s1": format_number(s1),
+            "a": format_number(a),
+            "b": format_number(b),
+            "c": format_number(c),
+            "x3": format_number(x3),
+            "f(x3)": format_number(fx3),
+            "Ea (%)": f"{Ea:.3f}" if Ea is not None else None,
+            "Et (%)": f"{Et:.3f}" if Et is not None else None,
+        }
+
+        # Update guesses for the next iteration
+        x0, x1, x2 = x1, x2, x3
+        f0, f1, f2 = f1, f2, fx3
+
+def muller(f, x0, x1, x2, max_iter=10, true_root=None, history=None, memoize=0):
     """
     Muller method with step-by-step details, formatting outputs, and error calculations.
 
@@ -9,69 +75,116 @@ def muller(f, x0, x1, x2, max_iter=10, true_root=None):
     x0, x1, x2 (complex): Initial guesses for the root (can be real or complex).
     max_iter (int): Maximum number of iterations.
     true_root (complex, optional): The true root for calculating Et.
+    history (IterationHistory, optional): Bounded store for the steps; by default every step is kept.
+    memoize (int): Remember this many distinct f(x) values (0 disables the memo cache).
 
     Returns:
     list: A list of dictionaries containing intermediate values for each iteration or an error message.
+    Each step also carries the running count of function evaluations.
     """
     try:
-        steps = []
-
-        def format_number(num):
-            """
-            Converts a complex number to formatted string with 3 decimal places.
-            Replaces `j` with `i` for complex numbers.
-            """
-            if np.isclose(num.imag, 0):  # Check if it's approximately real
-                return f"{num.real:.3f}"  # Format real part
-            return f"{num:.3f}".replace("j", "i")  # Format complex number with small 'i'
-
-        for i in range(max_iter):
-            h0 = x1 - x0
-            h1 = x2 - x1
-            s0 = (f(x1) - f(x0)) / h0
-            s1 = (f(x2) - f(x1)) / h1
-
-            a = (s1 - s0) / (h1 + h0)
-            b = a * h1 + s1
-            c = f(x2)
+        counted_f = CountedFunction(f, memoize)
 
-            discriminant = np.sqrt(b**2 - 4 * a * c)
-            x3 = x2 - (2 * c) / (b + np.sign(b.real) * discriminant)
-            fx3 = f(x3)
-
-            # Calculate errors
-            Ea = None
-            Et = None
-            if i > 0:  # Ea can only be calculated after the first iteration
-                Ea = abs((x3 - x2) / x3) * 100
-            if true_root is not None:  # Et requires a known true root
-                Et = abs((true_root - x3) / true_root) * 100
-
-            # Store all calculated values for this iteration
-            steps.append({
-                "iteration": i + 1,
-                "h0": format_number(h0),
-                "h1": format_number(h1),
-                "s0": format_number(s0),
-                "s1": format_number(s1),
-                "a": format_number(a),
-                "b": format_number(b),
-                "c": format_number(c),
-                "x3": format_number(x3),
-                "f(x3)": format_number(fx3),
-                "Ea (%)": f"{Ea:.3f}" if Ea is not None else None,
-                "Et (%)": f"{Et:.3f}" if Et is not None else None,
-            })
-
-            # Update guesses for the next iteration
-            x0, x1, x2 = x1, x2, x3
+        def counted_steps():
+            for step in iter_muller(counted_f, x0, x1, x2, max_iter, true_root):
+                step["evaluations"] = counted_f.evaluations
+                yield step
 
+        steps, _ = collect(counted_steps(), history)
         return steps
 
     except Exception:
         # Return a user-friendly error message if something goes wrong
         return {"error": "An error occurred during the Muller calculation. Please check your inputs."}
 
+def muller_batched(f, x0, x1, x2, args=(), atol=1e-12, rtol=1e-10, max_iterations=50):
+    """
+    Run the Muller method on many problems at once, one lane per starting triple.
+
+    The lanes work in complex arithmetic and advance together; a lane stops
+    when it converges, when its guesses coincide or the step denominator
+    vanishes ("degenerate"), or when it produces a NaN/inf ("nonfinite").
+    Status codes are those of secant.STATUS_NAMES.
+
+    Parameters:
+    f (function): Vectorized function, called as f(x, *args) with 1D complex arrays.
+    x0, x1, x2 (array_like): Initial guesses, broadcast against each other.
+    args (tuple): Per-lane parameters of f, broadcast together with the guesses.
+    atol, rtol (float): A lane converges when |x3 - x2| <= atol + rtol * |x3| or f(x3) == 0.
+    max_iterations (int): Maximum number of iterations per lane.
+
+    Returns:
+    dict: Per-lane "root", "f_root", "iterations" and "status", plus the total
+    number of function "evaluations".
+    """
+    x0, x1, x2, *params = np.broadcast_arrays(x0, x1, x2, *args)
+    shape = x0.shape
+    x0, x1, x2 = (np.array(x, dtype=complex).ravel() for x in (x0, x1, x2))
+    params = [a.ravel() for a in params]
+
+    def evaluate(x, params):
+        return np.broadcast_to(np.asarray(f(x, *params), dtype=complex), x.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        f0, f1, f2 = (evaluate(x, params) for x in (x0, x1, x2))
+        evaluations = 3 * x0.size
+
+        root = x2.copy()
+        f_root = f2.copy()
+        iterations = np.zeros(x0.size, dtype=int)
+        status = np.full(x0.size, MAX_ITERATIONS, dtype=np.int8)
+        lanes = np.arange(x0.size)  # Indices of the lanes still running
+
+        for i in range(max_iterations):
+            h0 = x1 - x0
+            h1 = x2 - x1
+            s0 = (f1 - f0) / h0
+            s1 = (f2 - f1) / h1
+
+            a = (s1 - s0) / (h1 + h0)
+            b = a * h1 + s1
+            c = f2
+
+            # Take the sign giving the larger denominator, the closer of the two roots
+            discriminant = np.sqrt(b**2 - 4 * a * c)
+            denominator = np.where(np.abs(b + discriminant) >= np.abs(b - discriminant), b + discriminant, b - discriminant)
+
+            # Lanes with coincident guesses or a vanishing denominator stop where they are
+            stalled = (h0 == 0) | (h1 == 0) | (h0 + h1 == 0) | (denominator == 0)
+            status[lanes[stalled]] = DEGENERATE
+            if stalled.any():
+                keep = ~stalled
+                lanes, x0, x1, x2, f0, f1, f2 = (v[keep] for v in (lanes, x0, x1, x2, f0, f1, f2))
+                c, denominator = c[keep], denominator[keep]
+                params = [p[keep] for p in params]
+            if lanes.size == 0:
+                break
+
+            x3 = x2 - (2 * c) / denominator
+            f3 = evaluate(x3, params)
+            evaluations += lanes.size
+
+            root[lanes] = x3
+            f_root[lanes] = f3
+            iterations[lanes] = i + 1
+
+            nonfinite = ~(np.isfinite(x3) & np.isfinite(f3))
+            converged = ~nonfinite & ((np.abs(x3 - x2) <= atol + rtol * np.abs(x3)) | (f3 == 0))
+            status[lanes[nonfinite]] = NONFINITE
+            status[lanes[converged]] = CONVERGED
+
+            keep = ~(nonfinite | converged)
+            lanes, x0, x1, x2, f0, f1, f2 = lanes[keep], x1[keep], x2[keep], x3[keep], f1[keep], f2[keep], f3[keep]
+            params = [p[keep] for p in params]
+
+    return {
+        "root": root.reshape(shape),
+        "f_root": f_root.reshape(shape),
+        "iterations": iterations.reshape(shape),
+        "status": status.reshape(shape),
+        "evaluations": evaluations
+    }
+
 
 # Example Usage
 if __name__ == "__main__":
@@ -0,0 +1,225 @@
+import numpy as np
+from sympy import Add, Mul, Poly, PolynomialError, Pow, symbols
+
+from expressions import parse_expression
+from muller import muller_batched
+
+# Starting triples tried together for each root, for a polynomial whose roots have geometric-mean
+# magnitude 1: one around the origin and one on each of several rays of the unit circle. The rays
+# are turned off the real axis so complex roots of real polynomials are reached quickly.
+_angles = np.exp(1j * (2 * np.pi * np.arange(4) / 4 + 0.3))
+STARTS = np.vstack([(0.5, -0.5, 0.0), np.column_stack([0.8 * _angles, 1.2 * _angles, _angles])])
+
+# Highest degree treated as a polynomial; x**1000 * x**1000 would otherwise expand into a long
+# coefficient list that every Horner evaluation loops over in Python
+MAX_DEGREE = 100
+
+def _degree_bound(expression, x):
+    """Upper bound on the degree of expression in x without expanding it (inf if not a polynomial in x)."""
+    if not expression.has(x):
+        return 0
+    if expression == x:
+        return 1
+    if isinstance(expression, Add):
+        return max(_degree_bound(term, x) for term in expression.args)
+    if isinstance(expression, Mul):
+        return sum(_degree_bound(factor, x) for factor in expression.args)
+    if isinstance(expression, Pow) and expression.exp.is_Integer and expression.exp >= 0:
+        return _degree_bound(expression.base, x) * int(expression.exp)
+    return float("inf")
+
+def polynomial_coefficients(equation, variable="x"):
+    """
+    Coefficients of a polynomial equation, or None when it is not a polynomial in the variable.
+
+    Polynomials of degree above MAX_DEGREE also give None, so callers fall
+    back to evaluating the expression directly.
+
+    Parameters:
+    equation (str): The function f(x) as typed by the user ("^" is accepted for powers).
+    variable (str): Name of the variable.
+
+    Returns:
+    numpy.ndarray or None: Coefficients from the highest power down (complex if any coefficient is).
+    """
+    x = symbols(variable)
+    try:
+        expression = parse_expression(equation, variable)
+        if _degree_bound(expression, x) > MAX_DEGREE:
+            return None
+        coefficients = [complex(c) for c in Poly(expression, x).all_coeffs()]
+    except (PolynomialError, SyntaxError, TypeError, ValueError):
+        return None
+
+    coefficients = np.array(coefficients)
+    if np.all(coefficients.imag == 0):
+        coefficients = coefficients.real
+    return coefficients
+
+def horner(coefficients, x):
+    """
+    Evaluate a polynomial with Horner's scheme.
+
+    Parameters:
+    coefficients (array_like): Coefficients from the highest power down.
+    x (scalar or array_like): Points to evaluate at.
+
+    Returns:
+    scalar or numpy.ndarray: p(x).
+    """
+    p = np.zeros_like(np.asarray(x), dtype=np.result_type(x, coefficients[0], float))
+    for c in coefficients:
+        p = p * x + c
+    return p
+
+def horner_with_derivative(coefficients, x):
+    """
+    Evaluate a polynomial and its derivative in one Horner pass.
+
+    Returns:
+    tuple: (p(x), p'(x)).
+    """
+    p = coefficients[0] * np.ones_like(x)
+    dp = np.zeros_like(p)
+    for c in coefficients[1:]:
+        dp = dp * x + p
+        p = p * x + c
+    return p, dp
+
+def backward_errors(coefficients, roots):
+    """
+    Relative residuals |p(r)| / sum(|c_k| |r|^k): how far the coefficients must move for r to be an exact root.
+    """
+    scale = horner(np.abs(coefficients), np.abs(roots))
+    return np.abs(horner(coefficients, roots)) / np.where(scale > 0, scale, 1)
+
+def deflate(coefficients, root):
+    """
+    Divide a polynomial by (x - root) with synthetic division.
+
+    Returns:
+    tuple: (quotient coefficients, remainder).
+    """
+    quotient = np.empty(len(coefficients) - 1, dtype=np.result_type(coefficients, root))
+    carry = 0
+    for i, c in enumerate(coefficients[:-1]):
+        carry = carry * root + c
+        quotient[i] = carry
+    return quotient, carry * root + coefficients[-1]
+
+def companion_roots(coefficients):
+    """Roots of a polynomial as the eigenvalues of its companion matrix."""
+    coefficients = np.asarray(coefficients)
+    n = len(coefficients) - 1
+    if n < 1:
+        return np.array([], dtype=complex)
+    companion = np.zeros((n, n), dtype=np.result_type(coefficients, float))
+    companion[0] = -coefficients[1:] / coefficients[0]
+    companion[np.arange(1, n), np.arange(n - 1)] = 1
+    return np.linalg.eigvals(companion)
+
+def polish(coefficients, root, tol=1e-14, max_iterations=20):
+    """
+    Refine a root on the original polynomial with Newton's method, undoing the error picked up by deflation.
+
+    Returns:
+    tuple: (polished root, Newton steps taken).
+    """
+    for i in range(max_iterations):
+        p, dp = horner_with_derivative(coefficients, root)
+        if dp == 0:
+            return root, i
+        step = p / dp
+        root = root - step
+        if abs(step) <= tol * max(abs(root), 1):
+            return root, i + 1
+    return root, max_iterations
+
+def _match_distances(roots, reference):
+    """Distance from each reference root to a distinct nearest root (greedy matching)."""
+    unused = list(range(len(roots)))
+    distances = []
+    for r in reference:
+        nearest = min(unused, key=lambda k: abs(roots[k] - r))
+        distances.append(abs(roots[nearest] - r))
+        unused.remove(nearest)
+    return np.array(distances)
+
+def polynomial_roots(coefficients, tol=1e-12, max_iterations=100, polish_roots=True):
+    """
+    Find all roots of a polynomial with Muller's method and deflation.
+
+    Each root is found with Muller on the deflated polynomial (several starting
+    triples in one batched run, keeping the smallest accurate root so deflation
+    stays stable). The polynomial is then divided by (x - root). Roots are
+    polished with Newton's method on the original polynomial and checked
+    against the companion-matrix eigenvalues.
+
+    Parameters:
+    coefficients (array_like): Coefficients from the highest power down.
+    tol (float): Relative tolerance of the Muller iterations.
+    max_iterations (int): Maximum Muller iterations per root.
+    polish_roots (bool): Refine every root on the original polynomial.
+
+    Returns:
+    dict: "roots", their "residuals" |p(root)| and relative "backward_errors",
+    the "companion_roots", the largest
+    distance between the two root sets ("max_discrepancy") and the number of
+    polynomial "evaluations" used by Muller.
+    """
+    coefficients = np.trim_zeros(np.asarray(coefficients), "f")
+    if len(coefficients) == 0:
+        raise ValueError("The zero polynomial has no isolated roots.")
+
+    # Zero roots come straight off the trailing zero coefficients
+    trimmed = np.trim_zeros(coefficients, "b")
+    roots = [0j] * (len(coefficients) - len(trimmed))
+    remaining = trimmed.astype(complex)
+    evaluations = 0
+
+    while len(remaining) > 2:
+        # Scale the starts to the geometric mean of the remaining root magnitudes
+        radius = abs(remaining[-1] / remaining[0]) ** (1 / (len(remaining) - 1))
+        starts = STARTS * (radius if radius > 0 else 1)
+        result = muller_batched(
+            lambda x, q=remaining: horner(q, x), starts[:, 0], starts[:, 1], starts[:, 2],
+            atol=0, rtol=tol, max_iterations=max_iterations
+        )
+        evaluations += result["evaluations"]
+
+        # Muller can stop on a flat stretch away from any root, so judge candidates by their
+        # residual relative to the size of the terms, and keep the smallest accurate one
+        candidates = result["root"][np.isfinite(result["root"])]
+        relative = backward_errors(remaining, candidates)
+        accurate = relative <= 100 * len(remaining) * np.finfo(float).eps
+        if accurate.any():
+            root = candidates[accurate][np.argmin(np.abs(candidates[accurate]))]
+        else:
+            root = candidates[np.argmin(relative)]  # Best effort, polishing may still fix it
+        roots.append(root)
+        remaining, _ = deflate(remaining, root)
+    if len(remaining) == 2:
+        roots.append(-remaining[1] / remaining[0])
+
+    roots = np.array(roots, dtype=complex)
+    if polish_roots:
+        roots = np.array([polish(coefficients, r)[0] for r in roots])
+
+    reference = companion_roots(coefficients)
+    return {
+        "roots": roots,
+        "residuals": np.abs(horner(coefficients, roots)),
+        "backward_errors": backward_errors(coefficients, roots),
+        "companion_roots": reference,
+        "max_discrepancy": _match_distances(roots, reference).max() if len(roots) else 0.0,
+        "evaluations": evaluations
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    coefficients = polynomial_coefficients("x**3 - 6*x + 8")
+    result = polynomial_roots(coefficients)
+    for root, residual in zip(result["roots"], result["residuals"]):
+        print(f"{root:.6f}  |p| = {residual:.1e}")
+    print(f"Largest distance to the companion-matrix roots: {result['max_discrepancy']:.1e}")
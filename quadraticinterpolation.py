@@ -1,19 +1,10 @@
-def quadratic_interpolation(f, x0, x1, x2):
+def parabolic_vertex(x0, x1, x2, f0, f1, f2):
     """
-    Perform quadratic interpolation to estimate x3 based on the given formula.
-
-    Parameters:
-    f (function): The function f(x) to interpolate.
-    x0, x1, x2 (float): Initial guesses.
+    Return the x of the vertex of the parabola through (x0, f0), (x1, f1), (x2, f2).
 
     Returns:
-    dict: Contains f(x0), f(x1), f(x2), and x3.
+    float or None: The vertex, or None when the points are collinear.
     """
-    # Compute function values
-    f0 = f(x0)
-    f1 = f(x1)
-    f2 = f(x2)
-
     # Compute numerator and denominator of x3
     numerator = (
         f0 * (x1**2 - x2**2)
@@ -27,9 +18,28 @@ def quadratic_interpolation(f, x0, x1, x2):
     )
 
     if denominator == 0:
-        raise ValueError("Denominator is zero. Interpolation failed.")
+        return None
+    return numerator / denominator
+
+def quadratic_interpolation(f, x0, x1, x2):
+    """
+    Perform quadratic interpolation to estimate x3 based on the given formula.
+
+    Parameters:
+    f (function): The function f(x) to interpolate.
+    x0, x1, x2 (float): Initial guesses.
 
-    x3 = numerator / denominator
+    Returns:
+    dict: Contains f(x0), f(x1), f(x2), and x3.
+    """
+    # Compute function values
+    f0 = f(x0)
+    f1 = f(x1)
+    f2 = f(x2)
+
+    x3 = parabolic_vertex(x0, x1, x2, f0, f1, f2)
+    if x3 is None:
+        raise ValueError("Denominator is zero. Interpolation failed.")
 
     return {
         "f(x0)": f0,
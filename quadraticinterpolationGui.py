@@ -1,5 +1,5 @@
 import streamlit as st
-from sympy import sympify, lambdify
+from expressions import compile_expression
 from quadraticinterpolation import quadratic_interpolation
 
 def quadratic_interpolation_app():
@@ -21,7 +21,7 @@ def quadratic_interpolation_app():
     if st.button("Solve Quadratic Interpolation"):
         try:
             # Convert the function to a callable form
-            f = lambdify("x", sympify(equation))
+            f = compile_expression(equation)
             
             # Perform quadratic interpolation
             result = quadratic_interpolation(f, x0, x1, x2)
@@ -0,0 +1,147 @@
+import numpy as np
+
+from muller import muller_batched
+from secant import CONVERGED, secant_batched
+
+def _evaluate_real(f, x):
+    """f on a real grid, with complex or undefined values turned into NaN."""
+    with np.errstate(all="ignore"):
+        fx = np.broadcast_to(np.asarray(f(x)), x.shape)
+    if np.iscomplexobj(fx):
+        fx = np.where(fx.imag == 0, fx.real, np.nan)
+    return fx.astype(float)
+
+def adaptive_grid(f, a, b, points=1000, max_depth=3, subdivisions=8, refine_factor=10, max_points=1_000_000):
+    """
+    Sample f on [a, b], refining the grid locally where f varies quickly.
+
+    Starts from a uniform grid and, up to max_depth times, splits every cell
+    whose change in f exceeds refine_factor times the median change (or with
+    only one finite end, at a pole or the edge of the domain) into subdivisions
+    cells. Each level is evaluated with one vectorized call on the new points only.
+
+    Parameters:
+    f (function): Vectorized function of x.
+    a, b (float): The interval to scan.
+    points (int): Size of the initial uniform grid.
+    max_depth (int): Maximum number of refinement levels.
+    subdivisions (int): Number of cells a refined cell is split into.
+    refine_factor (float): Refine cells that change more than this many median changes.
+    max_points (int): Stop refining once the grid holds this many points.
+
+    Returns:
+    tuple: (x, f(x), evaluations) on the refined grid.
+    """
+    x = np.linspace(a, b, points)
+    fx = _evaluate_real(f, x)
+    evaluations = x.size
+
+    for _ in range(max_depth):
+        change = np.abs(np.diff(fx))
+        finite = np.isfinite(change)
+        if not finite.any():
+            break
+        edge = np.isfinite(fx[:-1]) != np.isfinite(fx[1:])  # Domain edges and poles
+        refine = edge | (finite & (change > refine_factor * np.median(change[finite])))
+        refine &= np.diff(x) > 4 * np.finfo(float).eps * np.maximum(np.abs(x[:-1]), 1)
+        if not refine.any() or x.size + refine.sum() * (subdivisions - 1) > max_points:
+            break
+
+        widths = np.diff(x)[refine]
+        new_x = (x[:-1][refine, None] + widths[:, None] * np.arange(1, subdivisions) / subdivisions).ravel()
+        new_fx = _evaluate_real(f, new_x)
+        evaluations += new_x.size
+
+        order = np.argsort(np.concatenate([x, new_x]), kind="stable")
+        x = np.concatenate([x, new_x])[order]
+        fx = np.concatenate([fx, new_fx])[order]
+
+    return x, fx, evaluations
+
+def _deduplicate(roots, f_roots, tol):
+    """Merge roots closer than tol * max(1, |x|), keeping the one with the smallest |f|."""
+    order = np.argsort(roots)
+    roots, f_roots = roots[order], f_roots[order]
+    if roots.size == 0:
+        return roots, f_roots
+    new_group = np.diff(roots) > tol * np.maximum(np.abs(roots[1:]), 1)
+    groups = np.concatenate([[0], np.cumsum(new_group)])
+    keep = [np.flatnonzero(groups == g)[np.argmin(np.abs(f_roots[groups == g]))] for g in range(groups[-1] + 1)]
+    return roots[keep], f_roots[keep]
+
+def scan_roots(f, a, b, points=1000, max_depth=3, xtol=1e-12, ftol=1e-8, max_iterations=50, merge_tol=1e-8):
+    """
+    Find every real root of f in [a, b] without hand-picked starting guesses.
+
+    f is sampled on an adaptive grid (see adaptive_grid). Every sign change
+    seeds a secant run from the ends of its cell, and every local minimum of
+    |f| without a sign change (even-multiplicity roots, near misses) seeds a
+    Muller run from the three grid points around it. All runs of each kind
+    advance together in one batched call. Converged roots inside [a, b] with
+    |f(root)| <= ftol are kept, so poles that flip the sign are discarded,
+    and duplicates are merged.
+
+    Parameters:
+    f (function): Vectorized function of x (complex input must be accepted for the Muller runs).
+    a, b (float): The interval to scan.
+    points (int): Size of the initial uniform grid.
+    max_depth (int): Maximum number of grid refinement levels.
+    xtol (float): Step tolerance of the secant and Muller runs.
+    ftol (float): Largest |f(root)| accepted as a root.
+    max_iterations (int): Maximum iterations of each run.
+    merge_tol (float): Relative distance below which two roots are the same root.
+
+    Returns:
+    dict: Sorted "roots" and their "f_roots", the number of sign-change "brackets"
+    and "minima" used as seeds, the number of "grid_points" and the total
+    function "evaluations".
+    """
+    x, fx, evaluations = adaptive_grid(f, a, b, points, max_depth)
+    absf = np.abs(fx)
+
+    # Exact zeros on the grid, and cells where f changes sign
+    roots = [x[fx == 0]]
+    f_roots = [fx[fx == 0]]
+    change = np.sign(fx[:-1]) * np.sign(fx[1:]) < 0
+
+    # Interior minima of |f| that are not next to a sign change
+    i = np.arange(1, x.size - 1)
+    minima = i[(absf[i] < absf[i - 1]) & (absf[i] <= absf[i + 1]) & (fx[i] != 0) & ~change[i - 1] & ~change[i]]
+
+    if change.any():
+        result = secant_batched(f, x[:-1][change], x[1:][change], atol=xtol, rtol=xtol, max_iterations=max_iterations)
+        evaluations += result["evaluations"]
+        converged = result["status"] == CONVERGED
+        roots.append(result["root"][converged])
+        f_roots.append(result["f_root"][converged])
+
+    if minima.size:
+        result = muller_batched(
+            f, x[minima - 1], x[minima], x[minima + 1], atol=xtol, rtol=xtol, max_iterations=max_iterations
+        )
+        evaluations += result["evaluations"]
+        real = (result["status"] == CONVERGED) & (np.abs(result["root"].imag) <= xtol * np.maximum(np.abs(result["root"]), 1))
+        roots.append(result["root"][real].real)
+        f_roots.append(result["f_root"][real].real)
+
+    roots = np.concatenate(roots).astype(float)
+    f_roots = np.concatenate(f_roots).astype(float)
+    keep = (roots >= a) & (roots <= b) & (np.abs(f_roots) <= ftol)
+    roots, f_roots = _deduplicate(roots[keep], f_roots[keep], merge_tol)
+
+    return {
+        "roots": roots,
+        "f_roots": f_roots,
+        "brackets": int(change.sum()),
+        "minima": int(minima.size),
+        "grid_points": x.size,
+        "evaluations": evaluations
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    result = scan_roots(lambda x: np.sin(x) * (x - 2) ** 2, 0, 20)
+    print("Roots:", result["roots"])
+    print(f"{result['brackets']} brackets, {result['minima']} minima, {result['grid_points']} grid points, "
+          f"{result['evaluations']} evaluations")
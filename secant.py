@@ -1,45 +1,147 @@
-def secant_method_fixed_iterations(f, x0, x1, iterations=10):
+import numpy as np
+
+from cache import CountedFunction
+from history import collect
+
+# Per-lane status codes of the batched solvers
+CONVERGED, MAX_ITERATIONS, DEGENERATE, NONFINITE = range(4)
+STATUS_NAMES = ("converged", "max_iterations", "degenerate", "nonfinite")
+
+def iter_secant(f, x0, x1, iterations=10):
     """
-    Perform the Secant Method with a fixed number of iterations to solve f(x) = 0.
+    Run the Secant Method and yield the record of each iteration as it is computed.
 
-    Parameters:
-    f (function): The function for which the root is being calculated.
-    x0 (float): Initial guess x0.
-    x1 (float): Initial guess x1.
-    iterations (int): Number of iterations to perform.
+    Parameters are as for secant_method_fixed_iterations.
 
-    Returns:
-    dict: Contains the root approximation, iteration details, and the function value at each step.
+    Yields:
+    dict: Iteration number, x0, f(x0), x1, f(x1), x2 and f(x2).
     """
-    iteration_details = []
+    # Function values are carried between iterations, so each step costs one evaluation
+    fx0 = f(x0)
+    fx1 = f(x1)
 
     for i in range(iterations):
-        # Calculate f(x0) and f(x1)
-        fx0 = f(x0)
-        fx1 = f(x1)
-
         # Avoid division by zero
         if fx1 - fx0 == 0:
             raise ValueError("Division by zero encountered in the Secant Method.")
 
         # Calculate x2
         x2 = x1 - (fx1 * (x1 - x0)) / (fx1 - fx0)
+        fx2 = f(x2)
 
-        # Store iteration details
-        iteration_details.append({
+        yield {
             "Iteration": i + 1,
             "x0": x0,
             "f(x0)": fx0,
             "x1": x1,
             "f(x1)": fx1,
             "x2": x2,
-            "f(x2)": f(x2),
-        })
+            "f(x2)": fx2,
+        }
 
         # Update x0 and x1 for the next iteration
         x0, x1 = x1, x2
+        fx0, fx1 = fx1, fx2
+
+def secant_method_fixed_iterations(f, x0, x1, iterations=10, history=None, memoize=0):
+    """
+    Perform the Secant Method with a fixed number of iterations to solve f(x) = 0.
+
+    Parameters:
+    f (function): The function for which the root is being calculated.
+    x0 (float): Initial guess x0.
+    x1 (float): Initial guess x1.
+    iterations (int): Number of iterations to perform.
+    history (IterationHistory, optional): Bounded store for the iteration records;
+    by default every record is kept.
+    memoize (int): Remember this many distinct f(x) values (0 disables the memo cache).
+
+    Returns:
+    dict: Contains the root approximation, iteration details, the function value at each step
+    and the number of function evaluations.
+    """
+    counted_f = CountedFunction(f, memoize)
+    iteration_details, last = collect(iter_secant(counted_f, x0, x1, iterations), history)
+
+    return {
+        "root": last["x2"] if last else x1,
+        "iterations": iteration_details,
+        "evaluations": counted_f.evaluations
+    }
+
+def secant_batched(f, x0, x1, args=(), atol=1e-12, rtol=1e-10, max_iterations=50):
+    """
+    Run the Secant Method on many problems at once, one lane per starting pair.
+
+    All lanes advance together with array arithmetic. A lane stops as soon as
+    it converges, hits a zero denominator f(x1) - f(x0) ("degenerate") or
+    produces a NaN/inf ("nonfinite"); the other lanes carry on. f is only
+    evaluated on the lanes that are still running.
+
+    Parameters:
+    f (function): Vectorized function, called as f(x, *args) with 1D arrays.
+    x0, x1 (array_like): Initial guesses, broadcast against each other.
+    args (tuple): Per-lane parameters of f, broadcast together with the guesses.
+    atol, rtol (float): A lane converges when |x2 - x1| <= atol + rtol * |x2| or f(x2) == 0.
+    max_iterations (int): Maximum number of iterations per lane.
+
+    Returns:
+    dict: Per-lane "root", "f_root", "iterations" and "status" (codes indexing
+    STATUS_NAMES), plus the total number of function "evaluations".
+    """
+    x0, x1, *params = np.broadcast_arrays(x0, x1, *args)
+    shape = x0.shape
+    dtype = np.result_type(x0, x1, float)
+    x0 = x0.astype(dtype).ravel()
+    x1 = x1.astype(dtype).ravel()
+    params = [a.ravel() for a in params]
+
+    def evaluate(x, params):
+        return np.broadcast_to(np.asarray(f(x, *params)), x.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        fx0 = evaluate(x0, params)
+        fx1 = evaluate(x1, params)
+        evaluations = 2 * x0.size
+
+        root = x1.copy()
+        f_root = fx1.astype(np.result_type(fx1, dtype))
+        iterations = np.zeros(x0.size, dtype=int)
+        status = np.full(x0.size, MAX_ITERATIONS, dtype=np.int8)
+        lanes = np.arange(x0.size)  # Indices of the lanes still running
+
+        for i in range(max_iterations):
+            # Lanes with a flat secant stop where they are
+            stalled = fx1 == fx0
+            status[lanes[stalled]] = DEGENERATE
+            if stalled.any():
+                keep = ~stalled
+                lanes, x0, x1, fx0, fx1 = lanes[keep], x0[keep], x1[keep], fx0[keep], fx1[keep]
+                params = [a[keep] for a in params]
+            if lanes.size == 0:
+                break
+
+            x2 = x1 - (fx1 * (x1 - x0)) / (fx1 - fx0)
+            fx2 = evaluate(x2, params)
+            evaluations += lanes.size
+
+            root[lanes] = x2
+            f_root[lanes] = fx2
+            iterations[lanes] = i + 1
+
+            nonfinite = ~(np.isfinite(x2) & np.isfinite(fx2))
+            converged = ~nonfinite & ((np.abs(x2 - x1) <= atol + rtol * np.abs(x2)) | (fx2 == 0))
+            status[lanes[nonfinite]] = NONFINITE
+            status[lanes[converged]] = CONVERGED
+
+            keep = ~(nonfinite | converged)
+            lanes, x0, x1, fx0, fx1 = lanes[keep], x1[keep], x2[keep], fx1[keep], fx2[keep]
+            params = [a[keep] for a in params]
 
     return {
-        "root": x2,
-        "iterations": iteration_details
+        "root": root.reshape(shape),
+        "f_root": f_root.reshape(shape),
+        "iterations": iterations.reshape(shape),
+        "status": status.reshape(shape),
+        "evaluations": evaluations
     }
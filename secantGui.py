@@ -1,8 +1,9 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-from sympy import sympify, lambdify, symbols
+from expressions import compile_expression
 from secant import secant_method_fixed_iterations
+from rootscan import scan_roots
 
 def secant_method_app():
     st.header("Secant Method Solver")
@@ -15,17 +16,34 @@ def secant_method_app():
         help="Use 'x' for the variable and '**' for exponents. Example: x**3 - x - 2"
     )
 
-    # Inputs for x0, x1, and number of iterations
-    x0 = st.number_input("Enter the initial guess x0:", value=1.0)
-    x1 = st.number_input("Enter the initial guess x1:", value=2.0)
-    iterations = st.number_input("Enter the number of iterations:", value=5, step=1)
+    # Either scan an interval for every root or iterate from hand-picked guesses
+    scan = st.checkbox("Find all roots in an interval (no initial guesses needed)")
+    if scan:
+        a = st.number_input("Interval start a:", value=-10.0)
+        b = st.number_input("Interval end b:", value=10.0)
+    else:
+        # Inputs for x0, x1, and number of iterations
+        x0 = st.number_input("Enter the initial guess x0:", value=1.0)
+        x1 = st.number_input("Enter the initial guess x1:", value=2.0)
+        iterations = st.number_input("Enter the number of iterations:", value=5, step=1)
 
     if st.button("Solve with Secant Method"):
         try:
             # Convert the function to a callable form
-            x = symbols('x')
-            symbolic_f = sympify(equation)
-            f = lambdify(x, symbolic_f, modules=["numpy"])
+            f = compile_expression(equation)
+
+            if scan:
+                if a >= b:
+                    st.error("The interval start must be smaller than its end.")
+                    return
+                result = scan_roots(f, a, b)
+                st.success(f"Found {len(result['roots'])} root(s) in [{a}, {b}].")
+                st.dataframe(pd.DataFrame({"root": result["roots"], "f(root)": result["f_roots"]}))
+                st.write(
+                    f"{result['brackets']} sign changes and {result['minima']} local minima of |f| on "
+                    f"{result['grid_points']} grid points seeded the search ({result['evaluations']} evaluations)."
+                )
+                return
 
             # Solve using the Secant Method
             result = secant_method_fixed_iterations(f, x0, x1, iterations)